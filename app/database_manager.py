@@ -5,21 +5,168 @@ Handles psychometric assessments, evaluations, and user profiles
 """
 
 import os
+import atexit
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
-from pymongo import MongoClient
+from cachetools import TTLCache
+from pymongo import MongoClient, WriteConcern
 from pymongo.errors import ConnectionFailure
+import bson
 from bson import ObjectId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
 from dotenv import load_dotenv
 
+try:
+    import redis
+except ImportError:  # Redis is optional; only needed when REDIS_URL is set
+    redis = None
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Summary fields returned by get_user_evaluations unless fields are requested
+_EVALUATION_SUMMARY_FIELDS = (
+    "user_name",
+    "overall_score",
+    "entrepreneurial_fit",
+    "created_at",
+    "status",
+)
+
+# TTL (seconds) for documents shared through Redis
+_REDIS_TTL = int(os.getenv("REDIS_CACHE_TTL", 3600))
+
+_UTC = timezone.utc
+
+# Document shapes as (stored field, input key, default). Defaults are only
+# ever encoded to BSON, never mutated, so sharing them across docs is safe.
+_ASSESSMENT_FIELDS = (
+    ("assessment_id", "assessment_id", None),
+    ("title", "title", "Assessment"),
+    ("total_questions", "total_questions", 0),
+    ("questions", "questions", []),
+)
+
+_EVALUATION_FIELDS = (
+    ("overall_score", "overall_score", 0),
+    ("dimension_scores", "dimension_scores", {}),
+    ("strengths", "strengths", []),
+    ("areas_for_development", "areas_for_development", []),
+    ("personality_profile", "personality_profile", ""),
+    ("entrepreneurial_fit", "entrepreneurial_fit", {}),
+    ("recommendations", "recommendations", []),
+    ("completion_rate", "completion_rate", 0),
+    ("questions_answered", "questions_answered", 0),
+)
+
+_PROFILE_FIELDS = (
+    ("user_name", "user_name", "Unknown"),
+    ("psychometric_scores", "psychometric_scores", {}),
+    ("overall_score", "overall_psychometric_score", 0),
+    ("entrepreneurial_fit", "entrepreneurial_fit", "Medium"),
+    ("fit_score", "fit_score", 50),
+    ("top_strengths", "top_strengths", []),
+    ("development_areas", "development_areas", []),
+    ("personality_profile", "personality_profile", ""),
+    ("created_at", "created_at", None),
+    ("profile_completeness", "profile_completeness", 0),
+)
+
+
+def _shape(fields: Tuple[Tuple[str, str, Any], ...], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Project input data onto a stored document shape"""
+    get = data.get
+    return {dest: get(src, default) for dest, src, default in fields}
+
+
+class _ObjectIdAsStrDecoder(TypeDecoder):
+    """Decode ObjectId values straight to str during BSON decoding"""
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+
+# Read-side codec: documents come back with string ids, as the API returns them
+_STR_ID_CODEC = CodecOptions(type_registry=TypeRegistry([_ObjectIdAsStrDecoder()]))
+
+
+class BulkWriteBuffer:
+    """
+    Coalesces writes to one collection into periodic unordered bulk_writes
+
+    Callers add operations and return immediately; the buffer is flushed
+    by a timer flush_interval seconds after the first pending operation,
+    or at once when max_batch operations are queued. Errors are logged,
+    never raised, so only use it for writes nobody waits on.
+    """
+
+    def __init__(self, collection, flush_interval: float = 0.25, max_batch: int = 100):
+        self.collection = collection
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._ops: List[Any] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, operation: Any) -> None:
+        """Queue one write operation (InsertOne, UpdateOne, ...)"""
+        batch = None
+        with self._lock:
+            self._ops.append(operation)
+            if len(self._ops) >= self.max_batch:
+                batch = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._write(batch)
+
+    def flush(self) -> None:
+        """Write everything queued so far"""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._write(batch)
+
+    def _take(self) -> List[Any]:
+        """Detach the pending operations and disarm the timer (lock held)"""
+        batch, self._ops = self._ops, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _write(self, batch: List[Any]) -> None:
+        try:
+            result = self.collection.bulk_write(batch, ordered=False)
+            logger.debug(
+                "Flushed %d writes to %s (matched=%d)",
+                len(batch), self.collection.name, result.matched_count
+            )
+        except Exception as e:
+            logger.error(f"Failed to flush {len(batch)} writes to {self.collection.name}: {e}")
+
 
 class DatabaseManager:
-    """Manages MongoDB operations for psychometric data only"""
+    """
+    Manages MongoDB operations for psychometric data only
+
+    Uses the synchronous MongoClient on purpose: the service runs as a
+    threaded WSGI app, the client is thread-safe and releases the GIL while
+    waiting on the network, so one shared client serves concurrent requests.
+
+    The API endpoints use the connection, indexes, unacked handles and the
+    users write buffer, but query their collections through ``db`` directly
+    (they span the mentor collections and store their own record shape).
+    The CRUD helpers below (save_*/get_*/iter_user_evaluations/
+    update_assessment_status), and their caches, are not on any request path.
+    """
 
     def __init__(self):
         """Initialize MongoDB connection"""
@@ -31,20 +178,186 @@ class DatabaseManager:
 
         self.client = None
         self.db = None
+        self.assessments = None
+        self.evaluations = None
+        self.profiles = None
+        self.assessments_unacked = None
+        self.users_writes: Optional[BulkWriteBuffer] = None
+
+        # Read-through caches; assessments/evaluations are immutable once
+        # completed, profiles change only on re-evaluation
+        self._cache_lock = threading.RLock()
+        self._assessment_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+        self._eval_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+        self._profile_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+        self.redis = self._connect_redis()
         self._connect()
 
     def _connect(self):
         """Establish MongoDB connection"""
         try:
-            self.client = MongoClient(self.mongodb_url, serverSelectionTimeoutMS=5000)
+            self.client = MongoClient(
+                self.mongodb_url,
+                serverSelectionTimeoutMS=5000,
+                connectTimeoutMS=5000,
+                socketTimeoutMS=10000,
+                maxPoolSize=int(os.getenv("MONGO_MAX_POOL", 200)),
+                minPoolSize=int(os.getenv("MONGO_MIN_POOL", 10)),
+                maxIdleTimeMS=300_000,  # Drop connections idle for 5 minutes
+                retryWrites=True,
+                # Evaluation/profile payloads are text-heavy; the server picks
+                # the first compressor it also supports
+                compressors=os.getenv("MONGO_COMPRESSORS", "zstd,zlib"),
+                zlibCompressionLevel=6,
+                appname="pragati-psychometric"
+            )
             # Test connection
             self.client.admin.command('ping')
             self.db = self.client[self.database_name]
+            # Bound once; reads through these handles return string ids
+            self.assessments = self.db.get_collection(
+                "psychometric_assessments", codec_options=_STR_ID_CODEC
+            )
+            self.evaluations = self.db.get_collection(
+                "psychometric_evaluations", codec_options=_STR_ID_CODEC
+            )
+            self.profiles = self.db.get_collection(
+                "user_profiles", codec_options=_STR_ID_CODEC
+            )
+            # Fire-and-forget handle for bookkeeping writes that need no ack
+            self.assessments_unacked = self.assessments.with_options(
+                write_concern=WriteConcern(w=0)
+            )
+            # Post-evaluation users updates are batched across requests
+            self.users_writes = BulkWriteBuffer(
+                self.db.users,
+                flush_interval=int(os.getenv("USERS_WRITE_FLUSH_MS", 250)) / 1000,
+                max_batch=int(os.getenv("USERS_WRITE_MAX_BATCH", 100))
+            )
             logger.info(f"Connected to MongoDB: {self.database_name}")
         except ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
 
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Create indexes for the hot query patterns (idempotent, safe on every startup)"""
+        try:
+            self.evaluations.create_index(
+                [("user_id", 1), ("created_at", -1)]
+            )
+            self.assessments.create_index(
+                [("user_id", 1), ("status", 1)]
+            )
+            # Endpoint query shapes: evaluation history sorted by evaluated_at,
+            # and status updates keyed by (assessment_id, user_id). Not unique:
+            # regenerated assessments may legitimately reuse an assessment_id
+            self.evaluations.create_index(
+                [("user_id", 1), ("evaluated_at", -1)]
+            )
+            self.assessments.create_index(
+                [("assessment_id", 1), ("user_id", 1)]
+            )
+            # Same shapes on the mentor collections the endpoints read/write
+            self.db.mentor_evaluations.create_index(
+                [("user_id", 1), ("evaluated_at", -1)]
+            )
+            self.db.mentor_assessments.create_index(
+                [("assessment_id", 1), ("user_id", 1)]
+            )
+        except Exception as e:
+            # Missing indexes only cost performance; never block startup on them
+            logger.warning(f"Failed to ensure MongoDB indexes: {e}")
+
+        # Profiles are read and upserted by user_id (UserProfileManager uses
+        # the per-type collections). A unique build fails if legacy
+        # duplicates exist, so each gets its own attempt and one bad
+        # collection cannot skip the others
+        for collection in (self.profiles, self.db.entrepreneur_profiles, self.db.mentor_profiles):
+            try:
+                collection.create_index([("user_id", 1)], unique=True)
+            except Exception as e:
+                logger.warning(f"Failed to ensure unique user_id index on {collection.name}: {e}")
+
+    @staticmethod
+    def _build_assessment_doc(
+        user_id: str,
+        assessment_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the stored document for a psychometric assessment"""
+        doc = _shape(_ASSESSMENT_FIELDS, assessment_data)
+        doc["_id"] = ObjectId()
+        doc["user_id"] = user_id
+        doc["created_at"] = datetime.now(_UTC)
+        doc["status"] = "pending"
+        doc["evaluation_id"] = None
+        return doc
+
+    @staticmethod
+    def _build_evaluation_doc(
+        user_id: str,
+        user_name: str,
+        assessment_id: str,
+        evaluation_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the stored document for a psychometric evaluation"""
+        doc = _shape(_EVALUATION_FIELDS, evaluation_result)
+        doc["_id"] = ObjectId()
+        doc["user_id"] = user_id
+        doc["user_name"] = user_name
+        doc["assessment_id"] = assessment_id
+        doc["created_at"] = datetime.now(_UTC)
+        doc["status"] = "completed"
+        return doc
+
+    def _connect_redis(self):
+        """Connect the optional shared Redis cache (enabled by REDIS_URL)"""
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            return None
+        if redis is None:
+            logger.warning("REDIS_URL is set but the redis package is not installed")
+            return None
+        try:
+            client = redis.Redis.from_url(redis_url, socket_timeout=1)
+            client.ping()
+            logger.info("Connected to Redis read cache")
+            return client
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using MongoDB reads only: {e}")
+            return None
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Fetch a BSON-encoded document from Redis"""
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(key)
+            return bson.decode(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Redis get failed for {key}: {e}")
+            return None
+
+    def _redis_set(self, key: str, doc: Dict[str, Any]) -> None:
+        """Store a document in Redis as raw BSON"""
+        if self.redis is None:
+            return
+        try:
+            self.redis.setex(key, _REDIS_TTL, bson.encode(doc))
+        except Exception as e:
+            logger.warning(f"Redis set failed for {key}: {e}")
+
+    def _redis_delete(self, key: str) -> None:
+        """Invalidate a document in Redis"""
+        if self.redis is None:
+            return
+        try:
+            self.redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Redis delete failed for {key}: {e}")
+
     def save_assessment(
         self,
         user_id: str,
@@ -61,22 +374,11 @@ class DatabaseManager:
             Assessment ID (MongoDB ObjectId as string)
         """
         try:
-            assessment_doc = {
-                "_id": ObjectId(),
-                "user_id": user_id,
-                "assessment_id": assessment_data.get("assessment_id"),
-                "title": assessment_data.get("title", "Assessment"),
-                "total_questions": assessment_data.get("total_questions", 0),
-                "questions": assessment_data.get("questions", []),
-                "created_at": datetime.now(timezone.utc),
-                "status": "pending",
-                "evaluation_id": None
-            }
-
-            collection = self.db.psychometric_assessments
-            result = collection.insert_one(assessment_doc)
+            assessment_doc = self._build_assessment_doc(user_id, assessment_data)
+
+            result = self.assessments.insert_one(assessment_doc)
             assessment_id = str(result.inserted_id)
-            logger.info(f"Saved assessment: {assessment_id} for user: {user_id}")
+            logger.debug("Saved assessment: %s for user: %s", assessment_id, user_id)
             return assessment_id
 
         except Exception as e:
@@ -103,28 +405,13 @@ class DatabaseManager:
             Evaluation ID (MongoDB ObjectId as string)
         """
         try:
-            evaluation_doc = {
-                "_id": ObjectId(),
-                "user_id": user_id,
-                "user_name": user_name,
-                "assessment_id": assessment_id,
-                "overall_score": evaluation_result.get("overall_score", 0),
-                "dimension_scores": evaluation_result.get("dimension_scores", {}),
-                "strengths": evaluation_result.get("strengths", []),
-                "areas_for_development": evaluation_result.get("areas_for_development", []),
-                "personality_profile": evaluation_result.get("personality_profile", ""),
-                "entrepreneurial_fit": evaluation_result.get("entrepreneurial_fit", {}),
-                "recommendations": evaluation_result.get("recommendations", []),
-                "completion_rate": evaluation_result.get("completion_rate", 0),
-                "questions_answered": evaluation_result.get("questions_answered", 0),
-                "created_at": datetime.now(timezone.utc),
-                "status": "completed"
-            }
-
-            collection = self.db.psychometric_evaluations
-            result = collection.insert_one(evaluation_doc)
+            evaluation_doc = self._build_evaluation_doc(
+                user_id, user_name, assessment_id, evaluation_result
+            )
+
+            result = self.evaluations.insert_one(evaluation_doc)
             evaluation_id = str(result.inserted_id)
-            logger.info(f"Saved evaluation: {evaluation_id} for user: {user_id}")
+            logger.debug("Saved evaluation: %s for user: %s", evaluation_id, user_id)
             return evaluation_id
 
         except Exception as e:
@@ -147,81 +434,135 @@ class DatabaseManager:
             True if successful
         """
         try:
-            profile_doc = {
-                "user_id": user_id,
-                "user_name": profile_data.get("user_name", "Unknown"),
-                "psychometric_scores": profile_data.get("psychometric_scores", {}),
-                "overall_score": profile_data.get("overall_psychometric_score", 0),
-                "entrepreneurial_fit": profile_data.get("entrepreneurial_fit", "Medium"),
-                "fit_score": profile_data.get("fit_score", 50),
-                "top_strengths": profile_data.get("top_strengths", []),
-                "development_areas": profile_data.get("development_areas", []),
-                "personality_profile": profile_data.get("personality_profile", ""),
-                "created_at": profile_data.get("created_at"),
-                "last_updated": datetime.now(timezone.utc),
-                "profile_completeness": profile_data.get("profile_completeness", 0)
-            }
-
-            collection = self.db.user_profiles
-            result = collection.update_one(
+            profile_doc = _shape(_PROFILE_FIELDS, profile_data)
+            profile_doc["user_id"] = user_id
+            profile_doc["last_updated"] = datetime.now(_UTC)
+
+            self.profiles.update_one(
                 {"user_id": user_id},
                 {"$set": profile_doc},
                 upsert=True
             )
-            logger.info(f"Saved/updated profile for user: {user_id}")
+            self._cache_pop(self._profile_cache, user_id)
+            logger.debug("Saved/updated profile for user: %s", user_id)
             return True
 
         except Exception as e:
             logger.error(f"Failed to save user profile: {e}")
             return False
 
+    def _cache_get(self, cache: TTLCache, key: str) -> Optional[Dict[str, Any]]:
+        """Thread-safe cache lookup"""
+        with self._cache_lock:
+            return cache.get(key)
+
+    def _cache_set(self, cache: TTLCache, key: str, doc: Dict[str, Any]) -> None:
+        """Thread-safe cache store"""
+        with self._cache_lock:
+            cache[key] = doc
+
+    def _cache_pop(self, cache: TTLCache, key: str) -> None:
+        """Thread-safe cache invalidation"""
+        with self._cache_lock:
+            cache.pop(key, None)
+
     def get_assessment(self, assessment_id: str) -> Optional[Dict[str, Any]]:
-        """Get a psychometric assessment by ID"""
+        """Get a psychometric assessment by ID (cached; treat result as read-only)"""
+        if not ObjectId.is_valid(assessment_id):
+            return None
+        doc = self._cache_get(self._assessment_cache, assessment_id)
+        if doc is not None:
+            return doc
+        redis_key = f"asm:{assessment_id}"
+        doc = self._redis_get(redis_key)
+        if doc is not None:
+            self._cache_set(self._assessment_cache, assessment_id, doc)
+            return doc
         try:
-            collection = self.db.psychometric_assessments
-            doc = collection.find_one({"_id": ObjectId(assessment_id)})
+            doc = self.assessments.find_one({"_id": ObjectId(assessment_id)})
             if doc:
-                doc["_id"] = str(doc["_id"])
+                self._cache_set(self._assessment_cache, assessment_id, doc)
+                self._redis_set(redis_key, doc)
             return doc
         except Exception as e:
             logger.error(f"Failed to get assessment: {e}")
             return None
 
     def get_evaluation(self, evaluation_id: str) -> Optional[Dict[str, Any]]:
-        """Get a psychometric evaluation by ID"""
+        """Get a psychometric evaluation by ID (cached; treat result as read-only)"""
+        if not ObjectId.is_valid(evaluation_id):
+            return None
+        doc = self._cache_get(self._eval_cache, evaluation_id)
+        if doc is not None:
+            return doc
+        redis_key = f"eval:{evaluation_id}"
+        doc = self._redis_get(redis_key)
+        if doc is not None:
+            self._cache_set(self._eval_cache, evaluation_id, doc)
+            return doc
         try:
-            collection = self.db.psychometric_evaluations
-            doc = collection.find_one({"_id": ObjectId(evaluation_id)})
+            doc = self.evaluations.find_one({"_id": ObjectId(evaluation_id)})
             if doc:
-                doc["_id"] = str(doc["_id"])
+                self._cache_set(self._eval_cache, evaluation_id, doc)
+                self._redis_set(redis_key, doc)
             return doc
         except Exception as e:
             logger.error(f"Failed to get evaluation: {e}")
             return None
 
-    def get_user_evaluations(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get all evaluations for a user"""
+    def iter_user_evaluations(
+        self,
+        user_id: str,
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
+        batch_size: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a user's evaluations, newest first, one cursor batch at a time
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of evaluations to return
+            fields: Fields to return (defaults to a slim summary projection)
+            batch_size: Documents fetched per cursor round trip
+        """
+        projection = {field: 1 for field in (fields or _EVALUATION_SUMMARY_FIELDS)}
+        yield from (
+            self.evaluations.find({"user_id": user_id}, projection=projection)
+            .sort("created_at", -1)
+            .limit(limit)
+            .batch_size(batch_size)
+        )
+
+    def get_user_evaluations(
+        self,
+        user_id: str,
+        limit: int = 10,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all evaluations for a user
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of evaluations to return
+            fields: Fields to return (defaults to a slim summary projection)
+        """
         try:
-            collection = self.db.psychometric_evaluations
-            docs = list(
-                collection.find({"user_id": user_id})
-                .sort("created_at", -1)
-                .limit(limit)
-            )
-            for doc in docs:
-                doc["_id"] = str(doc["_id"])
-            return docs
+            return list(self.iter_user_evaluations(user_id, limit=limit, fields=fields))
         except Exception as e:
             logger.error(f"Failed to get user evaluations: {e}")
             return []
 
     def get_user_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user profile"""
+        """Get user profile (cached briefly; treat result as read-only)"""
+        doc = self._cache_get(self._profile_cache, user_id)
+        if doc is not None:
+            return doc
         try:
-            collection = self.db.user_profiles
-            doc = collection.find_one({"user_id": user_id})
-            if doc and "_id" in doc:
-                doc["_id"] = str(doc["_id"])
+            doc = self.profiles.find_one({"user_id": user_id})
+            if doc:
+                self._cache_set(self._profile_cache, user_id, doc)
             return doc
         except Exception as e:
             logger.error(f"Failed to get user profile: {e}")
@@ -233,20 +574,41 @@ class DatabaseManager:
         user_id: str,
         evaluation_id: str
     ) -> bool:
-        """Update assessment status after evaluation"""
+        """
+        Mark an assessment completed after evaluation (fire-and-forget)
+
+        The write is sent with w=0 and returns as soon as the driver has
+        written it to the socket. Server-side failures (e.g. no matching
+        assessment) are not reported back, so True only means the update
+        was sent; the evaluation itself is already persisted with an ack.
+        """
+        if not ObjectId.is_valid(assessment_id):
+            return False
         try:
-            collection = self.db.psychometric_assessments
-            collection.update_one(
+            self.assessments_unacked.update_one(
                 {"_id": ObjectId(assessment_id), "user_id": user_id},
                 {"$set": {"status": "completed", "evaluation_id": evaluation_id}}
             )
+            self._cache_pop(self._assessment_cache, assessment_id)
+            self._redis_delete(f"asm:{assessment_id}")
             return True
         except Exception as e:
             logger.error(f"Failed to update assessment status: {e}")
             return False
 
+    def unacked_collection(self, name: str):
+        """
+        Collection handle with WriteConcern(w=0) for fire-and-forget writes
+
+        Writes return once sent; server-side errors are never reported, so
+        use it only for bookkeeping the request does not depend on.
+        """
+        return self.db.get_collection(name, write_concern=WriteConcern(w=0))
+
     def close_connection(self):
         """Close MongoDB connection"""
+        if self.users_writes:
+            self.users_writes.flush()
         if self.client:
             self.client.close()
             logger.info("MongoDB connection closed")
@@ -254,11 +616,16 @@ class DatabaseManager:
 
 # Global database manager instance
 _db_manager: Optional[DatabaseManager] = None
+_db_lock = threading.Lock()
 
 
 def get_database_manager() -> DatabaseManager:
-    """Get or create global database manager instance"""
+    """Get or create global database manager instance (one MongoClient per process)"""
     global _db_manager
     if _db_manager is None:
-        _db_manager = DatabaseManager()
+        with _db_lock:
+            if _db_manager is None:
+                manager = DatabaseManager()
+                atexit.register(manager.close_connection)
+                _db_manager = manager
     return _db_manager
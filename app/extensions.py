@@ -5,10 +5,17 @@ Centralizes logging configuration and Flask utilities
 """
 
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import functools
+from types import MappingProxyType
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
 
 def setup_logging(app_name: str = "pragati-psychometric") -> logging.Logger:
     """
@@ -48,19 +55,70 @@ def setup_logging(app_name: str = "pragati-psychometric") -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Request threads only enqueue records; a single listener thread does
+    # the file/console I/O (including rollovers)
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(QueueHandler(log_queue))
+    logger.listener = listener
     
     return logger
 
 
+class OrJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+
+    Every jsonify() call goes through orjson. Types orjson cannot encode
+    natively (e.g. ObjectId) fall back to str(); datetimes are ISO 8601.
+    """
+
+    @staticmethod
+    def _encode(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        Build the jsonify() response straight from orjson's bytes (no str round trip)
+
+        Takes the same arguments as jsonify(): one positional value, several
+        (sent as a list), or keyword arguments (sent as an object).
+        """
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        if not args and not kwargs:
+            obj = None
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs
+        return self._app.response_class(self._encode(obj), mimetype=self.mimetype)
+
+
+@functools.lru_cache(maxsize=1)
 def get_config():
     """
     Get Flask configuration based on environment
     
+    Computed once per process; the result is read-only so callers cannot
+    mutate the cached mapping.
+    
     Returns:
-        Dictionary with Flask configuration
+        Read-only mapping with Flask configuration
     """
     flask_env = os.getenv("FLASK_ENV", "production")
     
@@ -73,7 +131,7 @@ def get_config():
         "JSONIFY_PRETTYPRINT_REGULAR": flask_env == "development",
     }
     
-    return config
+    return MappingProxyType(config)
 
 
 def init_app_config(app):
@@ -83,6 +141,4 @@ def init_app_config(app):
     Args:
         app: Flask application instance
     """
-    config = get_config()
-    for key, value in config.items():
-        app.config[key] = value
+    app.config.update(get_config())
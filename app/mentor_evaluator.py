@@ -6,18 +6,159 @@ Evaluates mentoring skills, domain expertise, and matching compatibility
 """
 
 import os
+import copy
+import hashlib
 import logging
-import json
 import re
-from typing import Dict, List, Optional, Any
+import sys
+from operator import itemgetter
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from types import MappingProxyType
+import orjson
+from cachetools import TTLCache
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
-from tenacity import retry, wait_exponential, stop_after_attempt
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Retry policy for the LLM calls: only transient transport/rate-limit/5xx
+# errors, with jitter so 429 bursts don't retry in lockstep; the last error
+# is re-raised as-is rather than as RetryError
+_LLM_RETRY = {
+    "retry": retry_if_exception_type(
+        (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    ),
+    "wait": wait_random_exponential(multiplier=1, max=20),
+    # No new attempt starts after 60s. This bounds the backoff, not the
+    # request: an attempt already in flight still runs up to the client
+    # timeout (and the OpenAI client's own retries)
+    "stop": stop_after_attempt(6) | stop_after_delay(60),
+    "reraise": True,
+}
+
+# Upper bound on parallel LLM calls in the batch evaluation path
+_LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+
+# Upper bound on output tokens for any single LLM call
+_MAX_OUTPUT_TOKENS = 16000
+
+# Seconds a generated question bank is reused for identical requests
+_QUESTION_CACHE_TTL = int(os.getenv("MENTOR_QUESTION_CACHE_TTL", 3600))
+
+# Mentor analysis prompt; filled with str.format in _build_analysis_prompt
+_ANALYSIS_PROMPT_TEMPLATE = """Analyze this MENTOR assessment (not entrepreneur) and return ONLY valid JSON.
+
+DIMENSION SCORES (weighted, out of 10):
+{dimension_details}
+
+OVERALL MENTOR SCORE: {overall_score:.2f}/10
+{background_context}
+
+Return EXACT JSON structure:
+{{
+  "mentor_profile_summary": "2-3 sentence summary of mentoring style, strengths, and approach",
+  "strengths": ["Top mentoring strength 1", "Top strength 2", "Top strength 3"],
+  "development_areas": ["Area to improve 1", "Area to improve 2"],
+  "mentoring_fit": {{
+    "overall_fit": "Excellent/Good/Moderate/Limited",
+    "fit_score": 0-100,
+    "reasoning": "Brief explanation of mentoring readiness",
+    "mentoring_readiness": "Ready/Needs Development/Not Ready"
+  }},
+  "teaching_style": "Primary teaching approach: Socratic/Hands-on/Directive/Collaborative/Challenging",
+  "ideal_mentee_profile": {{
+    "experience_level": "Early-stage/Growth-stage/Scaling founders",
+    "personality_fit": "Best mentee personality types",
+    "challenge_areas": "Problems mentor is best equipped to help with",
+    "industry_fit": "Industries where mentor adds most value"
+  }},
+  "mentoring_capacity": "How many mentees can effectively support: 1-2/3-5/6-10/10+",
+  "expertise_domains": ["Primary domain 1", "Secondary domain 2", "Tertiary domain 3"],
+  "recommendations": ["Actionable recommendation 1", "Recommendation 2", "Recommendation 3"],
+  "detailed_insights": {{
+    "communication_approach": "How mentor communicates and engages",
+    "feedback_style": "How mentor provides feedback",
+    "availability_pattern": "Time commitment and responsiveness",
+    "network_leverage": "How mentor uses their network",
+    "experience_depth": "Real-world experience level",
+    "empathy_score": "Emotional intelligence and patience level",
+    "unique_value": "Distinctive mentoring strengths"
+  }}
+}}
+
+Be specific, professional, and actionable. Focus on MENTORING capabilities, not entrepreneurship skills. NO MARKDOWN, NO EXTRA TEXT."""
+
+# Static part of the fallback analysis; the summary is filled per call
+_FALLBACK_ANALYSIS_TEMPLATE = MappingProxyType({
+    "strengths": ["Assessment completed successfully"],
+    "development_areas": ["Review detailed scores for specific insights"],
+    "mentoring_fit": {
+        "overall_fit": "Moderate",
+        "fit_score": 70,
+        "reasoning": "Assessment completed. Individual results vary by dimension.",
+        "mentoring_readiness": "Needs Development"
+    },
+    "teaching_style": "Mixed approach",
+    "ideal_mentee_profile": {
+        "experience_level": "Various",
+        "personality_fit": "Flexible",
+        "challenge_areas": "General business challenges",
+        "industry_fit": "Cross-industry"
+    },
+    "mentoring_capacity": "3-5 mentees",
+    "expertise_domains": ["To be determined"],
+    "recommendations": [
+        "Review dimension scores in detail",
+        "Clarify time commitment capacity",
+        "Identify primary expertise domains"
+    ],
+    "detailed_insights": {
+        "communication_approach": "Further analysis needed",
+        "feedback_style": "Review response patterns",
+        "availability_pattern": "Self-assessment recommended",
+        "network_leverage": "Context-dependent",
+        "experience_depth": "Moderate",
+        "empathy_score": "Moderate to high",
+        "unique_value": "Individual strengths identified"
+    }
+})
+
+@dataclass(slots=True)
+class AnsweredQuestion:
+    """One scored answer; kept compact until the result is assembled"""
+
+    question_id: str
+    question_text: str
+    dimension: str
+    selected_option: str
+    selected_text: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "question_id": self.question_id,
+            "question_text": self.question_text,
+            "dimension": self.dimension,
+            "selected_option": self.selected_option,
+            "selected_text": self.selected_text
+        }
+
 
 class MentorEvaluator:
     """
@@ -25,8 +166,8 @@ class MentorEvaluator:
     Assesses mentoring capabilities, teaching style, and domain expertise
     """
 
-    # Mentor-specific psychometric dimensions
-    DIMENSIONS = {
+    # Mentor-specific psychometric dimensions (read-only, shared across threads)
+    DIMENSIONS = MappingProxyType({
         "coaching_ability": {
             "name": "Coaching & Guidance",
             "description": "Ability to guide mentees without imposing solutions, facilitating their growth",
@@ -77,7 +218,16 @@ class MentorEvaluator:
             "description": "Holding mentees accountable while being reliable and following through on commitments",
             "weight": 1.0
         }
-    }
+    })
+
+    # Position of each dimension and its weight, for index-based accumulation
+    _DIM_INDEX = MappingProxyType({dim: i for i, dim in enumerate(DIMENSIONS)})
+    _DIM_WEIGHTS = tuple(info["weight"] for info in DIMENSIONS.values())
+
+    # Lookups derived once at class load
+    _DIM_NAMES = MappingProxyType({dim: info["name"] for dim, info in DIMENSIONS.items()})
+    _WEIGHT_BY_DIM = MappingProxyType({dim: info["weight"] for dim, info in DIMENSIONS.items()})
+    _TOTAL_WEIGHT = sum(_DIM_WEIGHTS)
 
     # Mentor expertise domains for matching
     EXPERTISE_DOMAINS = [
@@ -107,8 +257,15 @@ class MentorEvaluator:
         "Challenging (pushes mentee beyond comfort zone)"
     ]
 
+    # .env is read on first construction rather than at import
+    _dotenv_loaded = False
+
     def __init__(self, model: str = "gpt-4o-mini", timeout: int = 120):
         """Initialize the mentor evaluator with config validation"""
+        if not MentorEvaluator._dotenv_loaded:
+            load_dotenv()
+            MentorEvaluator._dotenv_loaded = True
+
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError(
@@ -121,55 +278,24 @@ class MentorEvaluator:
             model=model,
             temperature=0.7,
             api_key=api_key,
-            max_tokens=16000,  # Reduced from 16000
+            max_tokens=_MAX_OUTPUT_TOKENS,  # Ceiling; question calls pass a smaller budget
             timeout=timeout
         )
+        # Parsed question banks keyed by (num_questions, sorted focus domains)
+        self._question_cache: TTLCache = TTLCache(maxsize=64, ttl=_QUESTION_CACHE_TTL)
+        self._question_cache_lock = threading.Lock()
+
+        # LLM analyses keyed by rounded dimension vector + background digest;
+        # mentors with near-identical scores share one analysis
+        self._analysis_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+        self._analysis_cache_lock = threading.Lock()
         logger.info(f"Mentor Evaluator initialized with {model}")
 
-    @staticmethod
-    def _clean_json_response(content: str) -> str:
-        """Extract JSON from markdown-wrapped responses using regex"""
-        # Match content between `````` or ``````
-        match = re.search(r'``````', content, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return content
+    # Fixed instructions and example for question generation; only the short
+    # request suffix built in _build_questions_prompt varies per call
+    _QUESTION_PROMPT_HEADER = """Generate psychometric questions for MENTORS (not entrepreneurs).
 
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3))
-    def _call_llm_with_retry(self, prompt: str) -> str:
-        """Call LLM with exponential backoff retry logic"""
-        response = self.llm.invoke(prompt)
-        return response.content
-
-    def generate_questions(
-        self, 
-        num_questions: int = 25,
-        focus_domains: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
-        """
-        Generate dynamic mentor assessment questions with validated JSON output
-
-        Args:
-            num_questions: Number of questions to generate (default: 25)
-            focus_domains: Specific domains to focus on (optional)
-
-        Returns:
-            Dictionary containing questions and metadata
-
-        Raises:
-            ValueError: If JSON is invalid or required keys are missing
-        """
-        try:
-            logger.info(f"Generating {num_questions} mentor assessment questions...")
-            
-            # Build domain context
-            domain_context = ""
-            if focus_domains:
-                domain_context = f"\nFocus on these domains: {', '.join(focus_domains)}"
-            
-            prompt = f"""Generate EXACTLY {num_questions} psychometric questions for MENTORS (not entrepreneurs).
-
-CRITICAL: You MUST generate ALL {num_questions} questions. Do not generate fewer questions.
+CRITICAL: You MUST generate the EXACT number of questions requested at the end of this prompt. Do not generate fewer questions.
 
 CONTEXT: These mentors will guide entrepreneurs. Assess their mentoring capabilities, not their ability to run a business.
 
@@ -177,82 +303,82 @@ STRICT REQUIREMENTS:
 1. Return ONLY valid JSON - no markdown, no explanations, no comments
 2. Use double quotes for all keys and string values
 3. Ensure no trailing commas in arrays or objects
-4. Generate EXACTLY {num_questions} questions - this is mandatory
+4. Generate EXACTLY the requested number of questions - this is mandatory
 5. Cover ALL 10 mentor dimensions evenly: coaching_ability, domain_expertise, empathy, experience_breadth, network_strength, feedback_quality, availability, communication, adaptability, accountability
 6. Make scenarios realistic - mentoring situations, not business execution scenarios
 7. Include questions about past mentoring experience, teaching style preferences, and time commitment
 8. Each question must have 4 options (A, B, C, D)
-9. Question IDs should be: m1, m2, m3, ..., m{num_questions}
-{domain_context}
+9. Question IDs should be: m1, m2, m3, ... up to the requested count
+10. Use the assessment_id and estimated_time_minutes given in the request
 
-Return this JSON structure (with ALL {num_questions} questions):
-{{
-  "assessment_id": "mentor_assess_{num_questions}q_{datetime.now().strftime('%Y%m%d_%H%M')}",
+Return this JSON structure (with ALL requested questions):
+{
+  "assessment_id": "<assessment_id from the request>",
   "title": "Mentor Capability Assessment",
   "description": "Comprehensive evaluation of mentoring skills, expertise, and compatibility for guiding entrepreneurs",
   "assessment_type": "mentor",
-  "estimated_time_minutes": {max(10, num_questions // 2)},
+  "estimated_time_minutes": <estimated_time_minutes from the request>,
   "questions": [
-    {{
+    {
       "question_id": "m1",
       "dimension": "coaching_ability",
       "question_text": "A mentee comes to you confused about pivoting their business model. Your first instinct is to:",
       "question_type": "situational",
       "scenario_context": "Testing coaching approach vs. directive advice",
       "options": [
-        {{
+        {
           "option_id": "A",
           "text": "Ask probing questions to help them discover the right path themselves",
-          "score_profile": {{"coaching_ability": 9, "communication": 8, "empathy": 7}}
-        }},
-        {{
+          "score_profile": {"coaching_ability": 9, "communication": 8, "empathy": 7}
+        },
+        {
           "option_id": "B",
           "text": "Share a similar experience from your past and what you did",
-          "score_profile": {{"experience_breadth": 8, "communication": 7, "coaching_ability": 6}}
-        }},
-        {{
+          "score_profile": {"experience_breadth": 8, "communication": 7, "coaching_ability": 6}
+        },
+        {
           "option_id": "C",
           "text": "Provide a clear recommendation based on your expertise",
-          "score_profile": {{"domain_expertise": 8, "feedback_quality": 7, "coaching_ability": 4}}
-        }},
-        {{
+          "score_profile": {"domain_expertise": 8, "feedback_quality": 7, "coaching_ability": 4}
+        },
+        {
           "option_id": "D",
           "text": "Connect them with 2-3 experts who can provide different perspectives",
-          "score_profile": {{"network_strength": 9, "coaching_ability": 7, "communication": 6}}
-        }}
+          "score_profile": {"network_strength": 9, "coaching_ability": 7, "communication": 6}
+        }
       ]
-    }},
-    {{
+    },
+    {
       "question_id": "m2",
       "dimension": "availability",
       "question_text": "Regarding time commitment, how many hours per month can you realistically dedicate to mentoring?",
       "question_type": "commitment",
       "options": [
-        {{
+        {
           "option_id": "A",
           "text": "1-2 hours (ad-hoc availability)",
-          "score_profile": {{"availability": 3, "accountability": 3}}
-        }},
-        {{
+          "score_profile": {"availability": 3, "accountability": 3}
+        },
+        {
           "option_id": "B",
           "text": "3-5 hours (monthly check-ins + responsive messaging)",
-          "score_profile": {{"availability": 6, "accountability": 7}}
-        }},
-        {{
+          "score_profile": {"availability": 6, "accountability": 7}
+        },
+        {
           "option_id": "C",
           "text": "6-10 hours (bi-weekly meetings + active support)",
-          "score_profile": {{"availability": 9, "accountability": 9}}
-        }},
-        {{
+          "score_profile": {"availability": 9, "accountability": 9}
+        },
+        {
           "option_id": "D",
           "text": "10+ hours (weekly engagement + deep involvement)",
-          "score_profile": {{"availability": 10, "accountability": 10, "empathy": 8}}
-        }}
+          "score_profile": {"availability": 10, "accountability": 10, "empathy": 8}
+        }
       ]
-    }}
-    ... CONTINUE generating questions m3, m4, m5, etc. until you reach m{num_questions}
+    }
+    ... CONTINUE generating questions m3, m4, m5, etc. until you reach the requested count
   ]
-}}
+}
 
 IMPORTANT SCENARIOS TO COVER:
 - How they give feedback to struggling mentees
@@ -266,55 +392,206 @@ IMPORTANT SCENARIOS TO COVER:
 - Network leverage willingness
 - Teaching style adaptation
 
-REMINDER: Generate ALL {num_questions} questions. Count them before returning. The "questions" array must contain {num_questions} question objects.
+REMINDER: Count the questions before returning. The "questions" array must contain exactly the requested number of question objects."""
+
+    # JSON object inside a ```json ... ``` (or bare ```) fence; greedy so
+    # nested objects are kept whole
+    _JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
+
+    @classmethod
+    def _clean_json_response(cls, content: str) -> str:
+        """Extract JSON from markdown-wrapped responses using regex"""
+        match = cls._JSON_FENCE_RE.search(content)
+        if match:
+            return match.group(1)
+        return content.strip()
+
+    @retry(**_LLM_RETRY)
+    def _call_llm_with_retry(self, prompt: str, **llm_kwargs: Any) -> str:
+        """Call LLM with exponential backoff retry logic"""
+        try:
+            response = self.llm.invoke(prompt, **llm_kwargs)
+        except BadRequestError as e:
+            # Deterministic (bad prompt, context too long): never worth retrying
+            raise ValueError(f"Prompt rejected: {e}") from e
+        return response.content
+
+    @staticmethod
+    def _question_token_budget(num_questions: int) -> int:
+        """Output token budget for a question bank (~300 tokens per question)"""
+        return min(_MAX_OUTPUT_TOKENS, 300 * num_questions + 500)
+
+    def generate_questions(
+        self, 
+        num_questions: int = 25,
+        focus_domains: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate dynamic mentor assessment questions with validated JSON output
 
-Generate all {num_questions} questions now:"""
+        Args:
+            num_questions: Number of questions to generate (default: 25)
+            focus_domains: Specific domains to focus on (optional)
+
+        Returns:
+            Dictionary containing questions and metadata
+
+        Raises:
+            ValueError: If JSON is invalid or required keys are missing
+        """
+        cache_key = self._question_cache_key(num_questions, focus_domains)
+        cached = self._get_cached_questions(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info(f"Generating {num_questions} mentor assessment questions...")
+            prompt = self._build_questions_prompt(num_questions, focus_domains)
 
             # Get response with retry logic
-            raw_response = self._call_llm_with_retry(prompt)
-            cleaned_content = self._clean_json_response(raw_response)
-            
-            # Parse JSON
-            try:
-                questions_data = json.loads(cleaned_content)
-            except json.JSONDecodeError as json_err:
-                logger.error(f"JSON decode failed. Raw content: {raw_response[:500]}...")
-                raise ValueError(f"Invalid JSON from LLM: {json_err}")
-            
-            # Validate required schema
-            required_keys = {"assessment_id", "title", "questions"}
-            missing_keys = required_keys - questions_data.keys()
-            if missing_keys:
-                raise ValueError(f"Missing required keys in response: {missing_keys}")
-            
-            # Validate questions structure
-            if not isinstance(questions_data.get("questions"), list):
-                raise ValueError("Questions must be a list")
-            
-            # CHECK: Warn if fewer questions than requested
-            actual_count = len(questions_data["questions"])
-            if actual_count < num_questions:
-                logger.warning(
-                    f"Generated {actual_count} questions but {num_questions} were requested. "
-                    f"OpenAI may have hit token limits or context constraints."
-                )
-                print(f"⚠️  WARNING: Only {actual_count}/{num_questions} questions generated!")
-                print(f"💡 TIP: Try requesting fewer questions or increase max_tokens in __init__")
-            
-            # Add metadata
-            questions_data["generated_at"] = datetime.now().isoformat()
-            questions_data["total_questions"] = len(questions_data["questions"])
-            questions_data["schema_version"] = "1.0"
-            questions_data["assessment_type"] = "mentor"
-            
-            logger.info(f"Successfully generated {questions_data['total_questions']} mentor questions")
-            
+            raw_response = self._call_llm_with_retry(
+                prompt, max_tokens=self._question_token_budget(num_questions)
+            )
+            questions_data = self._parse_questions(raw_response, num_questions)
+            self._store_questions(cache_key, questions_data)
             return questions_data
-        
+
         except Exception as e:
             logger.error(f"Mentor question generation failed: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _prepare_question(question: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Intern repeated keys and stamp option_index (option_id -> position)
+
+        Dimension names and option ids recur across every question, so
+        interning them lets scoring lookups hit the identity fast path.
+        """
+        intern = sys.intern
+        dimension = question.get("dimension")
+        if isinstance(dimension, str):
+            question["dimension"] = intern(dimension)
+
+        option_index = {}
+        for i, opt in enumerate(question.get("options", [])):
+            option_id = opt.get("option_id")
+            if isinstance(option_id, str):
+                option_id = opt["option_id"] = intern(option_id)
+            score_profile = opt.get("score_profile")
+            if isinstance(score_profile, dict):
+                opt["score_profile"] = {
+                    intern(dim) if isinstance(dim, str) else dim: score
+                    for dim, score in score_profile.items()
+                }
+            option_index[option_id] = i
+        question["option_index"] = option_index
+        return question
+
+    @staticmethod
+    def _question_cache_key(
+        num_questions: int,
+        focus_domains: Optional[List[str]]
+    ) -> Tuple[int, Tuple[str, ...]]:
+        """Cache key for a question bank request"""
+        return num_questions, tuple(sorted(focus_domains or ()))
+
+    def _get_cached_questions(self, cache_key: Tuple[int, Tuple[str, ...]]) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh copy of a cached question bank, or None on a miss
+
+        The copy gets its own assessment_id and generated_at so callers can
+        store and mutate it independently of the cached template.
+        """
+        with self._question_cache_lock:
+            template = self._question_cache.get(cache_key)
+        if template is None:
+            return None
+
+        num_questions = cache_key[0]
+        now = datetime.now()
+        questions_data = copy.deepcopy(template)
+        questions_data["assessment_id"] = f"mentor_assess_{num_questions}q_{now.strftime('%Y%m%d_%H%M')}"
+        questions_data["generated_at"] = now.isoformat()
+        questions_data["total_questions"] = len(questions_data["questions"])
+        logger.info(f"Serving {num_questions} mentor questions from cache")
+        return questions_data
+
+    def _store_questions(self, cache_key: Tuple[int, Tuple[str, ...]], questions_data: Dict[str, Any]) -> None:
+        """Cache a private copy of a freshly generated question bank"""
+        template = copy.deepcopy(questions_data)
+        with self._question_cache_lock:
+            self._question_cache[cache_key] = template
+
+    def _build_questions_prompt(
+        self,
+        num_questions: int,
+        focus_domains: Optional[List[str]]
+    ) -> str:
+        """Build the question generation prompt: static header + per-request suffix"""
+        domain_context = ""
+        if focus_domains:
+            domain_context = f"\nFocus on these domains: {', '.join(focus_domains)}"
+
+        assessment_id = f"mentor_assess_{num_questions}q_{datetime.now().strftime('%Y%m%d_%H%M')}"
+        return (
+            f"{self._QUESTION_PROMPT_HEADER}\n\n"
+            "REQUEST:\n"
+            f"- Generate EXACTLY {num_questions} questions, IDs m1 to m{num_questions}\n"
+            f"- assessment_id: \"{assessment_id}\"\n"
+            f"- estimated_time_minutes: {max(10, num_questions // 2)}"
+            f"{domain_context}\n\n"
+            f"Generate all {num_questions} questions now:"
+        )
+
+    def _parse_questions(self, raw_response: str, num_questions: int) -> Dict[str, Any]:
+        """Parse and validate generated questions, then stamp metadata"""
+        cleaned_content = self._clean_json_response(raw_response)
+        
+        # Parse JSON
+        try:
+            questions_data = orjson.loads(cleaned_content)
+        except orjson.JSONDecodeError as json_err:
+            logger.error(f"JSON decode failed. Raw content: {raw_response[:500]}...")
+            raise ValueError(f"Invalid JSON from LLM: {json_err}")
+        
+        # Validate required schema
+        required_keys = {"assessment_id", "title", "questions"}
+        missing_keys = required_keys - questions_data.keys()
+        if missing_keys:
+            raise ValueError(f"Missing required keys in response: {missing_keys}")
+        
+        # Validate questions structure
+        if not isinstance(questions_data.get("questions"), list):
+            raise ValueError("Questions must be a list")
+        
+        # CHECK: Warn if fewer questions than requested
+        actual_count = len(questions_data["questions"])
+        if actual_count < num_questions:
+            logger.warning(
+                f"Generated {actual_count} questions but {num_questions} were requested. "
+                f"OpenAI may have hit token limits or context constraints."
+            )
+            logger.debug(
+                "Short question set (%d/%d); request fewer questions or raise "
+                "the output token budget", actual_count, num_questions
+            )
+        
+        # Intern keys and index option positions once so scoring is a dict
+        # lookup per answer
+        for question in questions_data["questions"]:
+            self._prepare_question(question)
+
+        # Add metadata
+        questions_data["generated_at"] = datetime.now().isoformat()
+        questions_data["total_questions"] = len(questions_data["questions"])
+        questions_data["schema_version"] = "1.0"
+        questions_data["assessment_type"] = "mentor"
+        
+        logger.info(f"Successfully generated {questions_data['total_questions']} mentor questions")
+        
+        return questions_data
+
     def evaluate_responses(
         self,
         questions_data: Dict[str, Any],
@@ -338,60 +615,8 @@ Generate all {num_questions} questions now:"""
             if not responses:
                 raise ValueError("No responses provided for evaluation")
 
-            # Calculate raw scores per dimension with weighted scoring
-            dimension_scores = {dim: [] for dim in self.DIMENSIONS.keys()}
-            answered_questions = []
-
-            # Build quick lookup for questions
-            question_map = {q["question_id"]: q for q in questions_data.get("questions", [])}
-
-            for q_id, selected_option_id in responses.items():
-                question = question_map.get(q_id)
-                if not question:
-                    logger.warning(f"Question {q_id} not found in assessment data")
-                    continue
-
-                # Find selected option
-                selected_option = next(
-                    (opt for opt in question.get("options", [])
-                     if opt.get("option_id") == selected_option_id),
-                    None
-                )
-
-                if not selected_option:
-                    logger.warning(f"Option {selected_option_id} not found for question {q_id}")
-                    continue
-
-                # Aggregate scores
-                score_profile = selected_option.get("score_profile", {})
-                for dimension, score in score_profile.items():
-                    if dimension in dimension_scores:
-                        dimension_scores[dimension].append(score)
-
-                # Record answer details
-                answered_questions.append({
-                    "question_id": q_id,
-                    "question_text": question.get("question_text", ""),
-                    "dimension": question.get("dimension", ""),
-                    "selected_option": selected_option_id,
-                    "selected_text": selected_option.get("text", "")
-                })
-
-            # Calculate weighted dimension averages
-            dimension_averages = {}
-            for dimension, scores in dimension_scores.items():
-                if scores:
-                    avg_score = sum(scores) / len(scores)
-                    weight = self.DIMENSIONS[dimension]["weight"]
-                    dimension_averages[dimension] = round(avg_score * weight, 2)
-                else:
-                    dimension_averages[dimension] = 0.0
-
-            # Calculate overall weighted score
-            total_weight = sum(self.DIMENSIONS[dim]["weight"] for dim in dimension_averages.keys())
-            overall_score = (
-                round(sum(dimension_averages.values()) / total_weight, 2)
-                if dimension_averages and total_weight > 0 else 0.0
+            dimension_averages, answered_questions, total_questions = self._score_responses(
+                questions_data, responses
             )
 
             # Generate AI-powered mentor analysis
@@ -402,47 +627,207 @@ Generate all {num_questions} questions now:"""
                 mentor_background
             )
 
-            # Compile final results
-            result = {
-                "assessment_id": questions_data.get("assessment_id", "unknown"),
-                "assessment_type": "mentor",
-                "evaluated_at": datetime.now().isoformat(),
-                "schema_version": "1.0",
-                "total_questions": len(question_map),
-                "questions_answered": len(answered_questions),
-                "completion_rate": round(
-                    len(answered_questions) / max(len(question_map), 1) * 100, 1
-                ),
-                "dimension_scores": dimension_averages,
-                "overall_mentor_score": overall_score,
-                "mentor_strengths": analysis.get("strengths", []),
-                "development_areas": analysis.get("development_areas", []),
-                "mentor_profile_summary": analysis.get("mentor_profile_summary", ""),
-                "mentoring_fit": analysis.get("mentoring_fit", {}),
-                "teaching_style": analysis.get("teaching_style", ""),
-                "ideal_mentee_profile": analysis.get("ideal_mentee_profile", {}),
-                "mentoring_capacity": analysis.get("mentoring_capacity", ""),
-                "expertise_domains": analysis.get("expertise_domains", []),
-                "recommendations": analysis.get("recommendations", []),
-                "detailed_insights": analysis.get("detailed_insights", {}),
-                "response_details": answered_questions
-            }
-
-            logger.info(
-                f"Mentor evaluation complete. Score: {result['overall_mentor_score']}/10, "
-                f"Completion: {result['completion_rate']}%"
+            return self._compile_result(
+                questions_data, dimension_averages, answered_questions, total_questions, analysis
             )
 
-            return result
-
         except Exception as e:
             logger.error(f"Mentor response evaluation failed: {e}", exc_info=True)
             raise
 
+    def evaluate_responses_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], Dict[str, str], Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate a cohort of mentors with one batched round of analysis calls
+
+        Scoring runs locally for every mentor first; the analysis prompts are
+        then sent together through llm.batch so they run in parallel.
+
+        Args:
+            items: List of (questions_data, responses, mentor_background)
+
+        Returns:
+            One evaluation result per item, in the same order
+
+        Raises:
+            ValueError: If any item has no responses
+        """
+        logger.info(f"Evaluating a batch of {len(items)} mentors...")
+
+        scored = []
+        analyses: List[Optional[Dict[str, Any]]] = []
+        pending = []  # (position, cache key, overall score, prompt) for cache misses
+        for questions_data, responses, mentor_background in items:
+            if not responses:
+                raise ValueError("No responses provided for evaluation")
+            dimension_averages, answered_questions, total_questions = self._score_responses(
+                questions_data, responses
+            )
+            scored.append((questions_data, dimension_averages, answered_questions, total_questions))
+
+            cache_key = self._analysis_cache_key(dimension_averages, mentor_background)
+            analysis = self._get_cached_analysis(cache_key)
+            if analysis is None:
+                overall_score = self._overall_score(dimension_averages)
+                prompt = self._build_analysis_prompt(dimension_averages, overall_score, mentor_background)
+                pending.append((len(analyses), cache_key, overall_score, prompt))
+            analyses.append(analysis)
+
+        if pending:
+            responses_out = self.llm.batch(
+                [prompt for _, _, _, prompt in pending],
+                config={"max_concurrency": _LLM_MAX_CONCURRENCY},
+                return_exceptions=True
+            )
+            for (position, cache_key, overall_score, _), response in zip(pending, responses_out):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    analysis = self._parse_analysis(response.content)
+                    self._store_analysis(cache_key, analysis)
+                except Exception as e:
+                    logger.error(f"Mentor AI analysis generation failed: {e}")
+                    analysis = self._fallback_analysis(overall_score)
+                analyses[position] = analysis
+
+        return [
+            self._compile_result(
+                questions_data, dimension_averages, answered_questions, total_questions, analysis
+            )
+            for (questions_data, dimension_averages, answered_questions, total_questions), analysis
+            in zip(scored, analyses)
+        ]
+
+    def _score_responses(
+        self,
+        questions_data: Dict[str, Any],
+        responses: Dict[str, str]
+    ) -> Tuple[Dict[str, float], List[AnsweredQuestion], int]:
+        """
+        Score responses against the question score profiles
+
+        Returns:
+            (weighted dimension averages, answered question details, total questions)
+        """
+        # Running sum/count per dimension position
+        dim_index = self._DIM_INDEX
+        sums = [0.0] * len(dim_index)
+        counts = [0] * len(dim_index)
+        answered_questions: List[AnsweredQuestion] = []
+
+        # Build quick lookup for questions
+        question_map = {q["question_id"]: q for q in questions_data.get("questions", [])}
+
+        for q_id, selected_option_id in responses.items():
+            question = question_map.get(q_id)
+            if not question:
+                logger.warning(f"Question {q_id} not found in assessment data")
+                continue
+
+            selected_option = self._find_option(question, selected_option_id)
+
+            if not selected_option:
+                logger.warning(f"Option {selected_option_id} not found for question {q_id}")
+                continue
+
+            # Aggregate scores
+            score_profile = selected_option.get("score_profile", {})
+            for dimension, score in score_profile.items():
+                i = dim_index.get(dimension)
+                if i is not None:
+                    sums[i] += score
+                    counts[i] += 1
+
+            # Record answer details
+            answered_questions.append(AnsweredQuestion(
+                q_id,
+                question.get("question_text", ""),
+                question.get("dimension", ""),
+                selected_option_id,
+                selected_option.get("text", "")
+            ))
+
+        # Calculate weighted dimension averages
+        weights = self._DIM_WEIGHTS
+        dimension_averages = {
+            dimension: round(sums[i] / counts[i] * weights[i], 2) if counts[i] else 0.0
+            for dimension, i in dim_index.items()
+        }
+
+        return dimension_averages, answered_questions, len(question_map)
+
+    @staticmethod
+    def _find_option(question: Dict[str, Any], option_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a question option by id
+
+        Uses the option_index stamped at generation time and falls back to
+        a scan for older assessments or options that were reordered since.
+        """
+        options = question.get("options", [])
+        position = question.get("option_index", {}).get(option_id)
+        if position is not None and position < len(options):
+            option = options[position]
+            if option.get("option_id") == option_id:
+                return option
+        return next((opt for opt in options if opt.get("option_id") == option_id), None)
+
+    def _overall_score(self, dimension_scores: Dict[str, float]) -> float:
+        """Overall weighted score from weighted dimension averages"""
+        # dimension_scores always carries every dimension, so the total is fixed
+        return sum(dimension_scores.values()) / self._TOTAL_WEIGHT
+
+    def _compile_result(
+        self,
+        questions_data: Dict[str, Any],
+        dimension_averages: Dict[str, float],
+        answered_questions: List[AnsweredQuestion],
+        total_questions: int,
+        analysis: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble the final evaluation result"""
+        # Calculate overall weighted score
+        overall_score = round(self._overall_score(dimension_averages), 2)
+
+        # Compile final results
+        result = {
+            "assessment_id": questions_data.get("assessment_id", "unknown"),
+            "assessment_type": "mentor",
+            "evaluated_at": datetime.now().isoformat(),
+            "schema_version": "1.0",
+            "total_questions": total_questions,
+            "questions_answered": len(answered_questions),
+            "completion_rate": round(
+                len(answered_questions) / max(total_questions, 1) * 100, 1
+            ),
+            "dimension_scores": dimension_averages,
+            "overall_mentor_score": overall_score,
+            "mentor_strengths": analysis.get("strengths", []),
+            "development_areas": analysis.get("development_areas", []),
+            "mentor_profile_summary": analysis.get("mentor_profile_summary", ""),
+            "mentoring_fit": analysis.get("mentoring_fit", {}),
+            "teaching_style": analysis.get("teaching_style", ""),
+            "ideal_mentee_profile": analysis.get("ideal_mentee_profile", {}),
+            "mentoring_capacity": analysis.get("mentoring_capacity", ""),
+            "expertise_domains": analysis.get("expertise_domains", []),
+            "recommendations": analysis.get("recommendations", []),
+            "detailed_insights": analysis.get("detailed_insights", {}),
+            "response_details": [answer.to_dict() for answer in answered_questions]
+        }
+
+        logger.info(
+            f"Mentor evaluation complete. Score: {result['overall_mentor_score']}/10, "
+            f"Completion: {result['completion_rate']}%"
+        )
+
+        return result
+
     def _generate_mentor_analysis(
         self,
         dimension_scores: Dict[str, float],
-        answered_questions: List[Dict[str, Any]],
+        answered_questions: List[AnsweredQuestion],
         questions_data: Dict[str, Any],
         mentor_background: Optional[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -458,140 +843,119 @@ Generate all {num_questions} questions now:"""
         Returns:
             Detailed mentor analysis dictionary
         """
-        try:
-            # Prepare dimension summary
-            dimension_details = "\n".join([
-                f"- {self.DIMENSIONS[dim]['name']}: {score:.2f}/10 (weight: {self.DIMENSIONS[dim]['weight']})"
-                for dim, score in sorted(dimension_scores.items(), key=lambda x: x[1], reverse=True)
-            ])
+        cache_key = self._analysis_cache_key(dimension_scores, mentor_background)
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
 
-            # Calculate total weighted score
-            total_weight = sum(self.DIMENSIONS[dim]["weight"] for dim in dimension_scores.keys())
-            overall_score = sum(dimension_scores.values()) / total_weight if total_weight > 0 else 0
-
-            # Add background context
-            background_context = ""
-            if mentor_background:
-                background_context = f"\n\nADDITIONAL CONTEXT:\n{json.dumps(mentor_background, indent=2)}"
-
-            prompt = f"""Analyze this MENTOR assessment (not entrepreneur) and return ONLY valid JSON.
-
-DIMENSION SCORES (weighted, out of 10):
-{dimension_details}
-
-OVERALL MENTOR SCORE: {overall_score:.2f}/10
-{background_context}
+        overall_score = self._overall_score(dimension_scores)
+        try:
+            prompt = self._build_analysis_prompt(dimension_scores, overall_score, mentor_background)
+            raw_response = self._call_llm_with_retry(prompt)
+            analysis = self._parse_analysis(raw_response)
+            self._store_analysis(cache_key, analysis)
+            return analysis
 
-Return EXACT JSON structure:
-{{
-  "mentor_profile_summary": "2-3 sentence summary of mentoring style, strengths, and approach",
-  "strengths": ["Top mentoring strength 1", "Top strength 2", "Top strength 3"],
-  "development_areas": ["Area to improve 1", "Area to improve 2"],
-  "mentoring_fit": {{
-    "overall_fit": "Excellent/Good/Moderate/Limited",
-    "fit_score": 0-100,
-    "reasoning": "Brief explanation of mentoring readiness",
-    "mentoring_readiness": "Ready/Needs Development/Not Ready"
-  }},
-  "teaching_style": "Primary teaching approach: Socratic/Hands-on/Directive/Collaborative/Challenging",
-  "ideal_mentee_profile": {{
-    "experience_level": "Early-stage/Growth-stage/Scaling founders",
-    "personality_fit": "Best mentee personality types",
-    "challenge_areas": "Problems mentor is best equipped to help with",
-    "industry_fit": "Industries where mentor adds most value"
-  }},
-  "mentoring_capacity": "How many mentees can effectively support: 1-2/3-5/6-10/10+",
-  "expertise_domains": ["Primary domain 1", "Secondary domain 2", "Tertiary domain 3"],
-  "recommendations": ["Actionable recommendation 1", "Recommendation 2", "Recommendation 3"],
-  "detailed_insights": {{
-    "communication_approach": "How mentor communicates and engages",
-    "feedback_style": "How mentor provides feedback",
-    "availability_pattern": "Time commitment and responsiveness",
-    "network_leverage": "How mentor uses their network",
-    "experience_depth": "Real-world experience level",
-    "empathy_score": "Emotional intelligence and patience level",
-    "unique_value": "Distinctive mentoring strengths"
-  }}
-}}
+        except Exception as e:
+            logger.error(f"Mentor AI analysis generation failed: {e}", exc_info=True)
+            return self._fallback_analysis(overall_score)
 
-Be specific, professional, and actionable. Focus on MENTORING capabilities, not entrepreneurship skills. NO MARKDOWN, NO EXTRA TEXT."""
+    @staticmethod
+    def _analysis_cache_key(
+        dimension_scores: Dict[str, float],
+        mentor_background: Optional[Dict[str, Any]]
+    ) -> Tuple[Tuple[float, ...], str]:
+        """Cache key: scores rounded to 1 decimal in dimension order + background digest"""
+        vector = tuple(round(score, 1) for _, score in sorted(dimension_scores.items()))
+        background = orjson.dumps(mentor_background or {}, option=orjson.OPT_SORT_KEYS)
+        return vector, hashlib.blake2b(background, digest_size=8).hexdigest()
+
+    def _get_cached_analysis(self, cache_key: Tuple[Tuple[float, ...], str]) -> Optional[Dict[str, Any]]:
+        """Return a private copy of a cached analysis, or None on a miss"""
+        with self._analysis_cache_lock:
+            analysis = self._analysis_cache.get(cache_key)
+        return copy.deepcopy(analysis) if analysis is not None else None
+
+    def _store_analysis(self, cache_key: Tuple[Tuple[float, ...], str], analysis: Dict[str, Any]) -> None:
+        """Cache a private copy of a successful LLM analysis (fallbacks are never cached)"""
+        template = copy.deepcopy(analysis)
+        with self._analysis_cache_lock:
+            self._analysis_cache[cache_key] = template
+
+    def _build_analysis_prompt(
+        self,
+        dimension_scores: Dict[str, float],
+        overall_score: float,
+        mentor_background: Optional[Dict[str, Any]]
+    ) -> str:
+        """Build the mentor analysis prompt"""
+        # Prepare dimension summary, highest score first
+        ranked = list(dimension_scores.items())
+        ranked.sort(key=itemgetter(1), reverse=True)
+        names, weights = self._DIM_NAMES, self._WEIGHT_BY_DIM
+        dimension_details = "\n".join([
+            f"- {names[dim]}: {score:.2f}/10 (weight: {weights[dim]})"
+            for dim, score in ranked
+        ])
+
+        # Add background context
+        background_context = ""
+        if mentor_background:
+            background_json = orjson.dumps(mentor_background, option=orjson.OPT_INDENT_2).decode()
+            background_context = f"\n\nADDITIONAL CONTEXT:\n{background_json}"
+
+        return _ANALYSIS_PROMPT_TEMPLATE.format(
+            dimension_details=dimension_details,
+            overall_score=overall_score,
+            background_context=background_context
+        )
 
-            raw_response = self._call_llm_with_retry(prompt)
-            cleaned_content = self._clean_json_response(raw_response)
+    def _parse_analysis(self, raw_response: str) -> Dict[str, Any]:
+        """Parse and sanity-check the mentor analysis JSON"""
+        cleaned_content = self._clean_json_response(raw_response)
 
-            try:
-                analysis = json.loads(cleaned_content)
-            except json.JSONDecodeError as json_err:
-                logger.error(f"Mentor analysis JSON decode failed: {json_err}")
-                raise ValueError(f"Invalid mentor analysis JSON from LLM: {json_err}")
+        try:
+            analysis = orjson.loads(cleaned_content)
+        except orjson.JSONDecodeError as json_err:
+            logger.error(f"Mentor analysis JSON decode failed: {json_err}")
+            raise ValueError(f"Invalid mentor analysis JSON from LLM: {json_err}")
 
-            # Validate required analysis keys
-            required_keys = {"mentor_profile_summary", "strengths", "mentoring_fit", "teaching_style"}
-            missing_keys = required_keys - analysis.keys()
-            if missing_keys:
-                logger.warning(f"Mentor analysis missing keys: {missing_keys}")
+        # Validate required analysis keys
+        required_keys = {"mentor_profile_summary", "strengths", "mentoring_fit", "teaching_style"}
+        missing_keys = required_keys - analysis.keys()
+        if missing_keys:
+            logger.warning(f"Mentor analysis missing keys: {missing_keys}")
 
-            return analysis
+        return analysis
 
-        except Exception as e:
-            logger.error(f"Mentor AI analysis generation failed: {e}", exc_info=True)
-            # Return safe fallback
-            return {
-                "mentor_profile_summary": (
-                    f"Mentor assessment indicates an overall score of {overall_score:.2f}/10. "
-                    "Further analysis recommended."
-                ),
-                "strengths": ["Assessment completed successfully"],
-                "development_areas": ["Review detailed scores for specific insights"],
-                "mentoring_fit": {
-                    "overall_fit": "Moderate",
-                    "fit_score": 70,
-                    "reasoning": "Assessment completed. Individual results vary by dimension.",
-                    "mentoring_readiness": "Needs Development"
-                },
-                "teaching_style": "Mixed approach",
-                "ideal_mentee_profile": {
-                    "experience_level": "Various",
-                    "personality_fit": "Flexible",
-                    "challenge_areas": "General business challenges",
-                    "industry_fit": "Cross-industry"
-                },
-                "mentoring_capacity": "3-5 mentees",
-                "expertise_domains": ["To be determined"],
-                "recommendations": [
-                    "Review dimension scores in detail",
-                    "Clarify time commitment capacity",
-                    "Identify primary expertise domains"
-                ],
-                "detailed_insights": {
-                    "communication_approach": "Further analysis needed",
-                    "feedback_style": "Review response patterns",
-                    "availability_pattern": "Self-assessment recommended",
-                    "network_leverage": "Context-dependent",
-                    "experience_depth": "Moderate",
-                    "empathy_score": "Moderate to high",
-                    "unique_value": "Individual strengths identified"
-                }
-            }
+    @staticmethod
+    def _fallback_analysis(overall_score: float) -> Dict[str, Any]:
+        """Safe analysis used when the LLM call or parsing fails"""
+        return {
+            "mentor_profile_summary": (
+                f"Mentor assessment indicates an overall score of {overall_score:.2f}/10. "
+                "Further analysis recommended."
+            ),
+            **copy.deepcopy(dict(_FALLBACK_ANALYSIS_TEMPLATE))
+        }
 
 
 class MentorEvaluatorSingleton:
     """Thread-safe singleton for MentorEvaluator"""
     _instance: Optional[MentorEvaluator] = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_instance(cls, **kwargs) -> MentorEvaluator:
-        """Get or create singleton instance"""
+        """Get or create singleton instance (double-checked locking)"""
         if cls._instance is None:
-            cls._instance = MentorEvaluator(**kwargs)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = MentorEvaluator(**kwargs)
         return cls._instance
 
 
 # Backward-compatible function
 def get_mentor_evaluator() -> MentorEvaluator:
-    """Get singleton instance of mentor evaluator"""
+    """Get singleton instance of mentor evaluator (created on first use)"""
     return MentorEvaluatorSingleton.get_instance()
-
-
-# Module-level singleton for convenience
-mentor_evaluator = get_mentor_evaluator()
@@ -5,665 +5,1257 @@ Handles both entrepreneur and mentor assessments based on user role
 Routes to appropriate evaluator and profile manager
 """
 
+import os
+import math
+import hashlib
 import logging
-from flask import jsonify, request
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+from flask import Response, g, jsonify, request, stream_with_context
 from .psychometric_evaluator import get_psychometric_evaluator
 from .mentor_evaluator import get_mentor_evaluator
 from .database_manager import get_database_manager
 from .user_profile_manager import get_user_profile_manager
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
 
 logger = logging.getLogger(__name__)
 
+# History listings skip the per-question answer log, the bulk of each document
+_EVALUATION_LIST_PROJECTION = {"evaluation_result.response_details": 0}
+
+# Per user type: (evaluator getter, assessments collection, evaluations collection)
+_EVAL_DISPATCH = {
+    'entrepreneur': (get_psychometric_evaluator, 'psychometric_assessments', 'psychometric_evaluations'),
+    'mentor': (get_mentor_evaluator, 'mentor_assessments', 'mentor_evaluations'),
+}
+
+# users-collection $set shape per user type: (score field, completed-at
+# field, (stored field, evaluation_result key, default) extras). Defaults
+# are only BSON-encoded, never mutated, so sharing them is safe.
+_USERS_UPDATE_SPEC = {
+    'entrepreneur': ("psychometricScore", "psychometricCompletedAt", ()),
+    'mentor': ("mentorPsychometricScore", "mentorPsychometricCompletedAt", (
+        ("mentorTeachingStyle", "teaching_style", ""),
+        ("mentorExpertiseDomains", "expertise_domains", []),
+        ("mentorCapacity", "mentoring_capacity", ""),
+    )),
+}
+
+# Evaluation collections and the type tag each contributes to listings
+_EVALUATION_COLLECTIONS = tuple(
+    (evaluations, user_type)
+    for user_type, (_, _, evaluations) in _EVAL_DISPATCH.items()
+)
+
+# Upper bound on evaluations returned per history page
+_MAX_EVALUATION_PAGE = 100
+
+# Upper bound on submissions accepted by the batch evaluate endpoint
+_MAX_EVALUATION_BATCH = int(os.getenv("MAX_EVALUATION_BATCH", 50))
+
+# Share of questions that must be answered before the evaluator is invoked
+_MIN_RESPONSE_RATIO = float(os.getenv("PSYCHOMETRIC_MIN_RESPONSE_RATIO", 0.5))
+
+# Background workers for post-evaluation writes (evaluation, status, profile)
+_WRITE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PERSIST_WORKERS", 4)),
+    thread_name_prefix="persist"
+)
+
+# Workers for the concurrent entrepreneur/mentor profile reads
+_PROFILE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PROFILE_READ_WORKERS", 4)),
+    thread_name_prefix="profile-read"
+)
+
+# Pre-generated question banks per (user_type, num_questions, focus_domains),
+# most recently used last; each shape keeps up to _QUESTION_POOL_DEPTH spare
+# banks topped up in the background. Every refill is a speculative LLM call,
+# so the pool is off (0) unless a deployment opts in
+_QUESTION_POOL: "OrderedDict[tuple, list]" = OrderedDict()
+_QUESTION_POOL_DEPTH = int(os.getenv("QUESTION_POOL_DEPTH", 0))
+_QUESTION_POOL_MAX_SHAPES = 32
+_question_pool_lock = threading.Lock()
+_question_pool_refilling = set()
+_REFILL_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="question-refill")
+
+# Singletons bound by register_psychometric_endpoints; None when the
+# dependency failed to initialise, so handlers can answer 503 instead
+_evaluators = {}
+_db_manager = None
+_profile_manager = None
+
+# Serialized GET /api/profile bodies, per user_id then per variant
+# (profile_type or validation context); dropped when an evaluation lands
+_PROFILE_RESPONSE_CACHE: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=int(os.getenv("PROFILE_RESPONSE_CACHE_TTL", 60))
+)
+_profile_response_lock = threading.Lock()
+
+# users.role by user_id; roles rarely change, so a short TTL is plenty
+_ROLE_CACHE: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=int(os.getenv("USER_ROLE_CACHE_TTL", 60))
+)
+_role_cache_lock = threading.Lock()
+
+# Request fields that may carry the role, checked in this order
+_ROLE_FIELDS = ("user_type", "user_role", "role", "assessment_type")
+_MENTOR_ROLES = frozenset({"mentor", "internal_mentor"})
+
+
+def _get_cached_profile_body(user_id: str, variant: str) -> Optional[bytes]:
+    """Return the cached response body for a user's profile variant, if any"""
+    with _profile_response_lock:
+        return _PROFILE_RESPONSE_CACHE.get(user_id, {}).get(variant)
+
+
+def _store_profile_body(user_id: str, variant: str, body: bytes) -> None:
+    """Cache a serialized profile response body"""
+    with _profile_response_lock:
+        variants = _PROFILE_RESPONSE_CACHE.get(user_id)
+        if variants is None:
+            variants = _PROFILE_RESPONSE_CACHE[user_id] = {}
+        variants[variant] = body
+
+
+def _invalidate_profile_bodies(user_id: str) -> None:
+    """Drop every cached profile response for a user"""
+    with _profile_response_lock:
+        _PROFILE_RESPONSE_CACHE.pop(user_id, None)
+
 
-def _determine_user_type(data: dict, user_id: str = None) -> str:
+def _etag_response(body: bytes) -> Response:
     """
-    Determine if user is entrepreneur or mentor based on request data or database
+    Wrap a JSON body with an ETag and honour If-None-Match
+    
+    Returns 304 with an empty body when the client already holds it.
+    """
+    response = Response(body, mimetype="application/json")
+    response.set_etag(hashlib.md5(body).hexdigest())
+    return response.make_conditional(request)
+
+
+def _build_users_update(
+    user_type: str,
+    overall_score: float,
+    completed_at: datetime,
+    evaluation_result: dict
+) -> dict:
+    """
+    Build the users-collection $set for a completed evaluation
     
     Args:
-        data: Request JSON data
-        user_id: User ID to fetch role from database if not in request
+        user_type: 'mentor' or 'entrepreneur'
+        overall_score: Rounded overall score
+        completed_at: Completion timestamp
+        evaluation_result: Evaluator output to copy extra fields from
         
     Returns:
-        'mentor' or 'entrepreneur'
+        Field -> value mapping for $set
     """
-    print("\n" + "🔍" * 35)
-    print("📋 DETERMINING USER TYPE FROM REQUEST DATA")
-    print("🔍" * 35)
-    
-    # Print all incoming data for debugging
-    print(f"📦 Full Request Data: {data}")
-    print(f"📦 Request Keys: {list(data.keys())}")
-    print(f"👤 User ID: {user_id}")
-    
-    # Check explicit user_type field
-    user_type = data.get('user_type', '').strip().lower() if data.get('user_type') else ''
-    print(f"🏷️  user_type field: '{user_type}' (type: {type(data.get('user_type'))})")
-    if user_type in ['mentor', 'internal_mentor']:
-        print(f"✅ ✅ ✅ MATCHED! User is MENTOR (via 'user_type' field)")
-        print("🔍" * 35 + "\n")
-        return 'mentor'
-    
-    # Check user_role field
-    user_role = data.get('user_role', '').strip().lower() if data.get('user_role') else ''
-    print(f"🏷️  user_role field: '{user_role}' (type: {type(data.get('user_role'))})")
-    if user_role in ['mentor', 'internal_mentor']:
-        print(f"✅ ✅ ✅ MATCHED! User is MENTOR (via 'user_role' field)")
-        print("🔍" * 35 + "\n")
-        return 'mentor'
-    
-    # Check role field (alternative)
-    role = data.get('role', '').strip().lower() if data.get('role') else ''
-    print(f"🏷️  role field: '{role}' (type: {type(data.get('role'))})")
-    if role in ['mentor', 'internal_mentor']:
-        print(f"✅ ✅ ✅ MATCHED! User is MENTOR (via 'role' field)")
-        print("🔍" * 35 + "\n")
-        return 'mentor'
-    
-    # Check assessment_type field (in case it's passed)
-    assessment_type = data.get('assessment_type', '').strip().lower() if data.get('assessment_type') else ''
-    print(f"🏷️  assessment_type field: '{assessment_type}' (type: {type(data.get('assessment_type'))})")
-    if assessment_type in ['mentor', 'internal_mentor']:
-        print(f"✅ ✅ ✅ MATCHED! User is MENTOR (via 'assessment_type' field)")
-        print("🔍" * 35 + "\n")
-        return 'mentor'
-    
-    # If no role in request body, fetch from database
-    if user_id:
-        print(f"\n🔍 No role in request body - Fetching from database...")
-        try:
-            db_manager = get_database_manager()
-            if db_manager:
-                user = db_manager.db.users.find_one(
-                    {"_id": ObjectId(user_id)},
-                    {"role": 1}
-                )
-                
-                if user:
-                    db_role = user.get('role', '').strip().lower()
-                    print(f"✅ Found user in database!")
-                    print(f"🏷️  Database role: '{db_role}'")
-                    
-                    if db_role in ['mentor', 'internal_mentor']:
-                        print(f"✅ ✅ ✅ MATCHED! User is MENTOR (from database)")
-                        print("🔍" * 35 + "\n")
-                        return 'mentor'
-                    else:
-                        print(f"📝 Database role '{db_role}' is not mentor role - defaulting to entrepreneur")
-                else:
-                    print(f"⚠️  User not found in database")
-            else:
-                print(f"⚠️  Database manager not available")
-        except Exception as e:
-            print(f"⚠️  Error fetching user from database: {e}")
-            logger.warning(f"Error fetching user role from database: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Default to entrepreneur
-    print(f"⚠️ ⚠️ ⚠️  NO MENTOR ROLE FOUND - Defaulting to: ENTREPRENEUR")
-    print(f"💡 TIP: Either send 'user_type'/'user_role'/'role' in request OR ensure user.role in DB = 'mentor'")
-    print("🔍" * 35 + "\n")
-    return 'entrepreneur'
+    score_field, completed_field, result_fields = _USERS_UPDATE_SPEC[user_type]
+    update_fields = {
+        "isPsychometricAnalysisDone": True,
+        score_field: overall_score,
+        completed_field: completed_at
+    }
+    for dest, src, default in result_fields:
+        update_fields[dest] = evaluation_result.get(src, default)
+    return update_fields
 
 
-def register_psychometric_endpoints(app):
-    """Register unified psychometric assessment endpoints with Flask app"""
+def _log_write_failure(future) -> None:
+    """Done-callback for _WRITE_POOL jobs: log any exception the job raised"""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Background write failed: {exc}", exc_info=exc)
+
+
+def _persist_evaluations(user_type: str, entries: list) -> None:
+    """
+    Persist evaluations of one user type and their side effects (runs on _WRITE_POOL)
+
+    Saves the evaluation records, flips the assessment statuses, updates
+    the users collection and creates/updates the profiles. Records and
+    status updates go out as one bulk write each, so a batch costs the
+    same round trips as a single evaluation. Failures are logged; the
+    client already has its results.
+
+    Args:
+        user_type: 'mentor' or 'entrepreneur', selects the collections
+        entries: (evaluation_oid, user_id, user_oid, user_name, assessment_id,
+            questions_answered, evaluation_result) per evaluation
+    """
+    db_manager = _db_manager
     
-    @app.route('/api/psychometric/generate', methods=['POST'])
-    def generate_psychometric_assessment():
-        """
-        Generate psychometric assessment (entrepreneur or mentor based on role)
-        
-        Request Body:
-        {
-            "num_questions": 20,
-            "user_id": "user123",
-            "user_type": "entrepreneur" | "mentor" | "internal_mentor",  # Optional
-            "user_role": "entrepreneur" | "mentor" | "internal_mentor",  # Optional
-            "role": "entrepreneur" | "mentor" | "internal_mentor",  # Optional
-            "focus_domains": ["Technology", "Marketing"]  # Optional, for mentors
-        }
-        
-        Note: If role fields are not provided, the system will fetch the user's role 
-        from the database using user_id
-        """
+    if not db_manager:
+        logger.warning("Database manager not available; evaluations not persisted")
+    else:
         try:
-            print("\n" + "="*70)
-            print("🎯 PSYCHOMETRIC ASSESSMENT GENERATION REQUEST")
-            print("="*70)
-            
-            data = request.get_json() or {}
-            print(f"📥 Raw Request Body: {data}")
-            
-            num_questions = data.get('num_questions', 20)
-            user_id = data.get('user_id', None)
-            focus_domains = data.get('focus_domains', None)
+            # Save evaluation records to appropriate collection
+            _, assessment_collection, collection_name = _EVAL_DISPATCH[user_type]
             
-            # Determine user type with detailed logging (now passes user_id)
-            user_type = _determine_user_type(data, user_id=user_id)
+            evaluation_records = [
+                {
+                    "_id": evaluation_oid,
+                    "user_id": user_id,
+                    "user_name": user_name,
+                    "user_type": user_type,
+                    "assessment_id": assessment_id,
+                    "evaluation_result": evaluation_result,
+                    "questions_answered": questions_answered,
+                    "overall_score": evaluation_result.get(
+                        'overall_score', 
+                        evaluation_result.get('overall_mentor_score')
+                    ),
+                    "completion_rate": evaluation_result.get('completion_rate'),
+                    "evaluated_at": evaluation_result.get('evaluated_at')
+                }
+                for evaluation_oid, user_id, _, user_name, assessment_id,
+                    questions_answered, evaluation_result in entries
+            ]
             
-            print(f"\n{'='*70}")
-            print(f"🎭 FINAL DETERMINED USER TYPE: **{user_type.upper()}**")
-            print(f"{'='*70}")
-            print(f"👤 User ID: {user_id}")
-            print(f"📊 Questions to Generate: {num_questions}")
-            print(f"🎯 Focus Domains: {focus_domains}")
+            db_manager.db[collection_name].insert_many(evaluation_records, ordered=False)
+            logger.info(f"Saved {len(evaluation_records)} {user_type} evaluation(s)")
             
-            # Validate number of questions
-            if not isinstance(num_questions, int) or num_questions < 5 or num_questions > 50:
-                return jsonify({
-                    "error": "Invalid number of questions",
-                    "message": "num_questions must be between 5 and 50"
-                }), 400
-            
-            logger.info(
-                f"Generating {num_questions} {user_type} psychometric questions "
-                f"for user: {user_id or 'anonymous'}"
-            )
-            
-            # Route to appropriate evaluator based on user type
-            print(f"\n🔀 ROUTING TO EVALUATOR...")
-            if user_type == 'mentor':
-                print(f"✅ ✅ ✅ Routing to: MENTOR EVALUATOR")
-                evaluator = get_mentor_evaluator()
-                print(f"✅ Mentor evaluator instance obtained")
-                questions_data = evaluator.generate_questions(
-                    num_questions=num_questions,
-                    focus_domains=focus_domains
+            # Update assessment statuses (fire-and-forget; the evaluations
+            # above are the durable record)
+            db_manager.unacked_collection(assessment_collection).bulk_write([
+                UpdateOne(
+                    {"assessment_id": assessment_id, "user_id": user_id},
+                    {"$set": {"status": "completed", "evaluation_id": str(evaluation_oid)}}
                 )
-                print(f"✅ MENTOR questions generated successfully!")
-            else:  # entrepreneur
-                print(f"✅ ✅ ✅ Routing to: ENTREPRENEUR EVALUATOR")
-                evaluator = get_psychometric_evaluator()
-                print(f"✅ Entrepreneur evaluator instance obtained")
-                questions_data = evaluator.generate_questions(num_questions=num_questions)
-                print(f"✅ ENTREPRENEUR questions generated successfully!")
-            
-            print(f"\n📝 Assessment Details:")
-            print(f"   - Assessment ID: {questions_data.get('assessment_id')}")
-            print(f"   - Title: {questions_data.get('title')}")
-            print(f"   - Type: {questions_data.get('assessment_type', user_type)}")
-            print(f"   - Total Questions: {questions_data.get('total_questions')}")
-            
-            # Optionally save to database
-            if user_id:
-                db_manager = get_database_manager()
-                if db_manager:
-                    try:
-                        # Store the assessment for later retrieval
-                        collection_name = (
-                            'mentor_assessments' if user_type == 'mentor' 
-                            else 'psychometric_assessments'
-                        )
-                        
-                        print(f"\n💾 Saving to database collection: {collection_name}")
-                        
-                        assessment_record = {
-                            "user_id": user_id,
-                            "user_type": user_type,
-                            "assessment_id": questions_data.get("assessment_id"),
-                            "assessment_type": questions_data.get("assessment_type", user_type),
-                            "questions_data": questions_data,
-                            "status": "pending",
-                            "generated_at": questions_data.get("generated_at")
-                        }
-                        
-                        db_manager.db[collection_name].insert_one(assessment_record)
-                        print(f"✅ {user_type.capitalize()} assessment saved to database")
-                        logger.info(
-                            f"{user_type.capitalize()} assessment saved to "
-                            f"database for user {user_id}"
-                        )
-                    except Exception as e:
-                        print(f"⚠️ WARNING: Failed to save assessment to DB: {e}")
-                        logger.warning(f"Failed to save assessment to DB: {e}")
-            
-            print(f"\n✅ GENERATION COMPLETE - Returning response")
-            print("="*70 + "\n")
+                for evaluation_oid, user_id, _, _, assessment_id, _, _ in entries
+            ], ordered=False)
             
-            return jsonify({
-                "success": True,
-                "assessment_id": questions_data.get("assessment_id"),
-                "assessment_type": user_type,
-                "title": questions_data.get("title"),
-                "description": questions_data.get("description"),
-                "estimated_time_minutes": questions_data.get("estimated_time_minutes"),
-                "total_questions": questions_data.get("total_questions"),
-                "questions": questions_data.get("questions"),
-                "generated_at": questions_data.get("generated_at")
-            })
+            # Update users collection
+            completed_at = datetime.now(timezone.utc)
+            for _, _, user_oid, _, _, _, evaluation_result in entries:
+                if user_oid is None:
+                    continue
+                overall_score = round(
+                    evaluation_result.get('overall_score', evaluation_result.get('overall_mentor_score', 0)), 
+                    2
+                )
+                
+                # Different fields based on user type
+                update_fields = _build_users_update(
+                    user_type, overall_score, completed_at, evaluation_result
+                )
+                
+                # Batched with other requests' updates into one bulk_write
+                db_manager.users_writes.add(
+                    UpdateOne({"_id": user_oid}, {"$set": update_fields})
+                )
+                logger.info(f"Queued users update for {user_type}: score={overall_score}")
+                _invalidate_cached_role(user_oid)
         
         except Exception as e:
-            print(f"\n❌ ERROR in generate_psychometric_assessment:")
-            print(f"   Error Type: {type(e).__name__}")
-            print(f"   Error Message: {str(e)}")
-            logger.error(f"Failed to generate assessment: {e}")
-            import traceback
-            traceback.print_exc()
-            return jsonify({
-                "error": "Failed to generate assessment",
-                "details": str(e)
-            }), 500
+            logger.warning(f"Failed to save evaluations to DB: {e}", exc_info=True)
+    
+    # Create/update user profiles
+    for _, user_id, _, _, _, _, evaluation_result in entries:
+        try:
+            if not _profile_manager:
+                logger.warning("Profile manager not available; profile not updated")
+                continue
+            _profile_manager.create_profile_from_psychometric(
+                user_id=user_id,
+                evaluation_result=evaluation_result,
+                user_type=user_type  # Pass user type to profile manager
+            )
+            logger.info(f"{user_type.capitalize()} profile created/updated for: {user_id}")
+        except Exception as e:
+            logger.warning(f"Failed to create {user_type} profile: {e}")
+        finally:
+            _invalidate_profile_bodies(user_id)
+
+
+def _load_stored_questions(
+    db_manager,
+    user_type: str,
+    assessment_id: str,
+    user_id: str
+) -> Optional[dict]:
+    """
+    Fetch the questions_data saved by the generate endpoint
+    
+    Args:
+        db_manager: Database manager (may be None)
+        user_type: 'mentor' or 'entrepreneur', selects the collection
+        assessment_id: Assessment ID returned by generate
+        user_id: Owner of the assessment
+        
+    Returns:
+        The stored questions_data, or None if unavailable
+    """
+    if not db_manager:
+        return None
+    
+    collection_name = _EVAL_DISPATCH[user_type][1]
+    # Ids are unique since they carry an ObjectId suffix; older records may
+    # share a minute-stamped id, so prefer the newest of those
+    assessment = db_manager.db[collection_name].find_one(
+        {"assessment_id": assessment_id, "user_id": user_id},
+        {"questions_data": 1, "_id": 0},
+        sort=[("generated_at", -1)]
+    )
+    return assessment.get("questions_data") if assessment else None
+
+
+def _parse_user_oid(user_id: Optional[str]) -> Optional[ObjectId]:
+    """
+    Parse a request user_id into an ObjectId once per request
+    
+    Args:
+        user_id: User ID from the request body
+        
+    Returns:
+        The ObjectId, or None for anonymous requests
+        
+    Raises:
+        InvalidId, TypeError: If user_id is not a valid ObjectId
+    """
+    if user_id in (None, '', 'anonymous'):
+        return None
+    return ObjectId(user_id)
+
+
+def _service_unavailable_response(service: str):
+    """503 response for a dependency that failed to initialise"""
+    return jsonify({
+        "error": f"{service} not available",
+        "message": "Service is starting up or misconfigured; try again later"
+    }), 503
+
+
+def _invalid_user_id_response():
+    """400 response for a user_id that is not an ObjectId"""
+    return jsonify({
+        "error": "Invalid user_id",
+        "message": "user_id must be a 24-character hex ObjectId"
+    }), 400
+
+
+def _get_cached_role(user_oid: ObjectId) -> str:
+    """
+    Look up a user's role in the users collection, memoized for a short TTL
+    
+    Args:
+        user_oid: Parsed user ID
+        
+    Returns:
+        Normalized role, or '' if the user or database is unavailable
+    """
+    with _role_cache_lock:
+        role = _ROLE_CACHE.get(user_oid)
+    if role is not None:
+        return role
+    
+    if not _db_manager:
+        return ''
+    try:
+        user = _db_manager.db.users.find_one(
+            {"_id": user_oid},
+            {"role": 1}
+        )
+    except Exception as e:
+        logger.warning(f"Error fetching user role from database: {e}")
+        return ''
+    
+    role = (user.get('role') or '').strip().lower() if user else ''
+    with _role_cache_lock:
+        _ROLE_CACHE[user_oid] = role
+    return role
+
+
+def _invalidate_cached_role(user_oid: ObjectId) -> None:
+    """Forget a memoized role after the user's record is written"""
+    with _role_cache_lock:
+        _ROLE_CACHE.pop(user_oid, None)
+
+
+def _determine_user_type(
+    data: dict,
+    user_id: str = None,
+    user_oid: Optional[ObjectId] = None
+) -> str:
+    """
+    Determine if user is entrepreneur or mentor based on request data or database
+    
+    Args:
+        data: Request JSON data
+        user_id: User ID (used for logging)
+        user_oid: Parsed user ID to fetch role from database if not in request
+        
+    Returns:
+        'mentor' or 'entrepreneur'
+    """
+    # Check the role-carrying request fields in priority order; most
+    # requests carry none, so skip the normalisation when none is present
+    if not data.keys().isdisjoint(_ROLE_FIELDS):
+        for field in _ROLE_FIELDS:
+            value = data.get(field)
+            if value and value.strip().lower() in _MENTOR_ROLES:
+                logger.debug("User %s is mentor (via '%s' field)", user_id, field)
+                return 'mentor'
+    
+    # If no role in request body, fetch from database (cached per user)
+    if user_oid is not None:
+        db_role = _get_cached_role(user_oid)
+        if db_role in _MENTOR_ROLES:
+            logger.debug("User %s is mentor (from database)", user_id)
+            return 'mentor'
+    
+    # Default to entrepreneur
+    logger.debug("No mentor role found for user %s; defaulting to entrepreneur", user_id)
+    return 'entrepreneur'
+
+
+def _generate_questions(
+    user_type: str,
+    num_questions: int,
+    focus_domains: Optional[list]
+) -> dict:
+    """Generate a question bank with the evaluator for user_type"""
+    # Only the mentor generator takes focus domains
+    extra_kwargs = {'focus_domains': focus_domains} if user_type == 'mentor' else {}
+    return _evaluators[user_type].generate_questions(
+        num_questions=num_questions,
+        **extra_kwargs
+    )
+
+
+def _with_unique_assessment_id(questions_data: dict) -> dict:
+    """
+    Shallow copy of a question bank with a per-request assessment_id
+    
+    Evaluator ids are only stamped to the minute, and cached, coalesced
+    or pooled banks can reach several users with the same one. The
+    ObjectId suffix keeps every stored assessment addressable on its own.
+    """
+    base_id = questions_data.get("assessment_id") or "assess"
+    return {**questions_data, "assessment_id": f"{base_id}_{ObjectId()}"}
+
+
+def _question_pool_key(
+    user_type: str,
+    num_questions: int,
+    focus_domains: Optional[list]
+) -> Optional[Tuple]:
+    """
+    Pool key for a generate request, or None if it should not be pooled
+    
+    Mentor banks are not pooled: MentorEvaluator already serves repeat
+    shapes from its question cache, so a refill would mostly store a copy.
+    """
+    if _QUESTION_POOL_DEPTH <= 0 or user_type == 'mentor':
+        return None
+    return user_type, num_questions, ()
+
+
+def _take_pooled_questions(key: Tuple) -> Optional[dict]:
+    """
+    Pop a spare question bank for this shape and restamp it
+    
+    The bank gets a fresh assessment_id and generated_at so it reads as
+    generated now.
+    """
+    with _question_pool_lock:
+        banks = _QUESTION_POOL.get(key)
+        if not banks:
+            return None
+        _QUESTION_POOL.move_to_end(key)
+        questions_data = banks.pop()
+    
+    user_type, num_questions, _ = key
+    prefix = 'mentor_assess' if user_type == 'mentor' else 'assess'
+    now = datetime.now()
+    questions_data["assessment_id"] = f"{prefix}_{num_questions}q_{now.strftime('%Y%m%d_%H%M')}"
+    questions_data["generated_at"] = now.isoformat()
+    return questions_data
+
+
+def _refill_question_pool(key: Tuple) -> None:
+    """Generate banks for one shape until it holds _QUESTION_POOL_DEPTH spares"""
+    user_type, num_questions, focus_domains = key
+    try:
+        while True:
+            with _question_pool_lock:
+                if len(_QUESTION_POOL.get(key, ())) >= _QUESTION_POOL_DEPTH:
+                    return
+            questions_data = _generate_questions(
+                user_type, num_questions, list(focus_domains) or None
+            )
+            with _question_pool_lock:
+                _QUESTION_POOL.setdefault(key, []).append(questions_data)
+                _QUESTION_POOL.move_to_end(key)
+                while len(_QUESTION_POOL) > _QUESTION_POOL_MAX_SHAPES:
+                    _QUESTION_POOL.popitem(last=False)
+    except Exception as e:
+        logger.warning(f"Failed to refill question pool for {key}: {e}")
+    finally:
+        with _question_pool_lock:
+            _question_pool_refilling.discard(key)
+
+
+def _schedule_question_refill(key: Tuple) -> None:
+    """Top up a shape's spare banks in the background (one refill per shape)"""
+    if _QUESTION_POOL_DEPTH <= 0:
+        return
+    with _question_pool_lock:
+        if key in _question_pool_refilling:
+            return
+        _question_pool_refilling.add(key)
+    _REFILL_POOL.submit(_refill_question_pool, key)
+
+
+def _determine_user_type_cached(
+    data: dict,
+    user_id: str = None,
+    user_oid: Optional[ObjectId] = None
+) -> str:
+    """
+    _determine_user_type memoized on flask.g for the current request
+    
+    Later code in the same request (or middleware) can ask again for free.
+    """
+    cache = g.setdefault('_user_type_cache', {})
+    user_type = cache.get(user_id)
+    if user_type is None:
+        user_type = cache[user_id] = _determine_user_type(data, user_id, user_oid)
+    return user_type
+
+
+def _resolve_evaluation_input(
+    data: dict,
+    user_type: str,
+    user_id: str
+) -> Tuple[Optional[dict], Optional[Tuple[dict, int]]]:
+    """
+    Validate an evaluation request and resolve its questions
+
+    questions_data may be omitted when assessment_id points at an
+    assessment stored at generation. Thin submissions are rejected before
+    the evaluator is paid for; only answers to questions in this
+    assessment count.
+    
+    Returns:
+        (questions_data, None) on success, or (None, (error body, status))
+    """
+    missing_fields = [] if 'responses' in data else ['responses']
+    if 'questions_data' not in data and 'assessment_id' not in data:
+        missing_fields.append('questions_data or assessment_id')
+    
+    if missing_fields:
+        return None, ({
+            "error": "Missing required fields",
+            "missing": missing_fields
+        }, 400)
+    
+    questions_data = data.get('questions_data')
+    if questions_data is None:
+        questions_data = _load_stored_questions(
+            _db_manager, user_type, data['assessment_id'], user_id
+        )
+        if questions_data is None:
+            return None, ({
+                "error": "Assessment not found",
+                "message": "No stored questions for this assessment_id; send questions_data"
+            }, 404)
+    
+    responses = data['responses']
+    if not isinstance(responses, dict):
+        return None, ({
+            "error": "Invalid responses",
+            "message": "responses must map question_id to option_id"
+        }, 400)
+    
+    questions = questions_data.get('questions', [])
+    total_questions = questions_data.get('total_questions') or len(questions)
+    answered = len(responses.keys() & {q.get('question_id') for q in questions})
+    required = max(1, math.ceil(total_questions * _MIN_RESPONSE_RATIO))
+    
+    if answered < required:
+        return None, ({
+            "error": "Insufficient responses",
+            "received": answered,
+            "required": required,
+            "total_questions": total_questions
+        }, 400)
+    
+    return questions_data, None
+
+
+def _prepare_evaluation_persist(
+    evaluation_result: dict,
+    user_id: str,
+    user_oid: Optional[ObjectId],
+    user_name: str,
+    user_type: str,
+    assessment_id: str,
+    questions_answered: int
+) -> tuple:
+    """Stamp user info on a result and build its _persist_evaluations entry"""
+    evaluation_result['user_id'] = user_id
+    evaluation_result['user_name'] = user_name
+    evaluation_result['user_type'] = user_type
+    
+    return (
+        ObjectId(),
+        user_id,
+        user_oid,
+        user_name,
+        assessment_id,
+        questions_answered,
+        dict(evaluation_result)
+    )
+
+
+def _queue_evaluations_persist(user_type: str, entries: list) -> None:
+    """Persist prepared evaluations of one user type on the background pool"""
+    _WRITE_POOL.submit(
+        _persist_evaluations, user_type, entries
+    ).add_done_callback(_log_write_failure)
+
+
+def generate_psychometric_assessment():
+    """
+    Generate psychometric assessment (entrepreneur or mentor based on role)
     
+    Request Body:
+    {
+        "num_questions": 20,
+        "user_id": "665f1c2ab3e4d5f6a7b8c9d0",
+        "user_type": "entrepreneur" | "mentor" | "internal_mentor",  # Optional
+        "user_role": "entrepreneur" | "mentor" | "internal_mentor",  # Optional
+        "role": "entrepreneur" | "mentor" | "internal_mentor",  # Optional
+        "focus_domains": ["Technology", "Marketing"]  # Optional, for mentors
+    }
     
-    @app.route('/api/psychometric/evaluate', methods=['POST'])
-    def evaluate_psychometric_responses():
-        """
-        Evaluate psychometric assessment responses (entrepreneur or mentor)
-        """
+    Note: If role fields are not provided, the system will fetch the user's role 
+    from the database using user_id
+    """
+    try:
+        data = request.get_json() or {}
+        
+        num_questions = data.get('num_questions', 20)
+        user_id = data.get('user_id', None)
+        focus_domains = data.get('focus_domains', None)
+        
         try:
-            print("\n" + "="*70)
-            print("🔍 PSYCHOMETRIC EVALUATION REQUEST RECEIVED")
-            print("="*70)
-            
-            # Step 1: Parse request data
-            data = request.get_json()
-            print(f"📥 Request data received: {data is not None}")
-            
-            if not data:
-                print("❌ ERROR: Empty request body")
-                return jsonify({
-                    "error": "Invalid request",
-                    "message": "Request body is required"
-                }), 400
-            
-            # Extract user_id first
-            user_id = data.get('user_id', 'anonymous')
-            
-            # Step 2: Determine user type (now with database lookup)
-            user_type = _determine_user_type(data, user_id=user_id)
-            
-            print(f"\n{'='*70}")
-            print(f"🎭 USER TYPE FOR EVALUATION: **{user_type.upper()}**")
-            print(f"{'='*70}")
-            
-            # Step 3: Validate required fields
-            print("\n📋 Validating required fields...")
-            required_fields = ['questions_data', 'responses']
-            missing_fields = [field for field in required_fields if field not in data]
-            
-            if missing_fields:
-                print(f"❌ ERROR: Missing fields: {missing_fields}")
-                return jsonify({
-                    "error": "Missing required fields",
-                    "missing": missing_fields
-                }), 400
-            
-            print("✅ All required fields present")
-            
-            # Step 4: Extract data
-            questions_data = data['questions_data']
-            responses = data['responses']
-            user_name = data.get('user_name', 'Anonymous User')
-            assessment_id = data.get('assessment_id', questions_data.get('assessment_id', 'unknown'))
-            mentor_background = data.get('mentor_background', None)
-            
-            print(f"\n👤 User ID: {user_id}")
-            print(f"👤 User Name: {user_name}")
-            print(f"👤 User Type: {user_type}")
-            print(f"📝 Assessment ID: {assessment_id}")
-            print(f"📊 Total Questions: {questions_data.get('total_questions', 0)}")
-            print(f"✍️ Responses Received: {len(responses)}")
-            
-            logger.info(f"Evaluating {user_type} psychometric responses for user: {user_id}")
-            logger.info(f"Received {len(responses)} responses")
-            
-            # Step 5: Route to appropriate evaluator
-            print(f"\n🧠 Starting {user_type} evaluation process...")
-            
-            if user_type == 'mentor':
-                print(f"✅ ✅ ✅ Using MENTOR EVALUATOR")
-                evaluator = get_mentor_evaluator()
-                print("✅ Mentor evaluator instance obtained")
-                evaluation_result = evaluator.evaluate_responses(
-                    questions_data, 
-                    responses,
-                    mentor_background
-                )
-            else:  # entrepreneur
-                print(f"✅ ✅ ✅ Using ENTREPRENEUR EVALUATOR")
-                evaluator = get_psychometric_evaluator()
-                print("✅ Entrepreneur evaluator instance obtained")
-                evaluation_result = evaluator.evaluate_responses(questions_data, responses)
-            
-            print(f"✅ Evaluation completed successfully")
-            overall_score = evaluation_result.get('overall_score', evaluation_result.get('overall_mentor_score'))
-            print(f"📊 Overall Score: {overall_score}/10")
-            print(f"📈 Completion Rate: {evaluation_result.get('completion_rate')}%")
-            
-            # Add user information
-            evaluation_result['user_id'] = user_id
-            evaluation_result['user_name'] = user_name
-            evaluation_result['user_type'] = user_type
-            
-            # Step 6: Save to database
-            print(f"\n💾 Saving {user_type} evaluation to database...")
-            db_manager = get_database_manager()
-            evaluation_id = None
-            
-            if not db_manager:
-                print("⚠️ WARNING: Database manager not available")
-            else:
-                print("✅ Database manager connected")
-                
+            user_oid = _parse_user_oid(user_id)
+        except (InvalidId, TypeError):
+            return _invalid_user_id_response()
+        
+        # Determine user type (falls back to the users collection via user_id)
+        user_type = _determine_user_type_cached(data, user_id=user_id, user_oid=user_oid)
+        logger.debug(
+            "Generate request: user_type=%s user_id=%s num_questions=%s focus_domains=%s",
+            user_type, user_id, num_questions, focus_domains
+        )
+        
+        # Validate number of questions
+        if not isinstance(num_questions, int) or num_questions < 5 or num_questions > 50:
+            return jsonify({
+                "error": "Invalid number of questions",
+                "message": "num_questions must be between 5 and 50"
+            }), 400
+        
+        if not _evaluators.get(user_type):
+            return _service_unavailable_response("Evaluator")
+        
+        logger.info(
+            f"Generating {num_questions} {user_type} psychometric questions "
+            f"for user: {user_id or 'anonymous'}"
+        )
+        
+        # Serve a pre-generated bank for this shape when one is ready,
+        # otherwise generate inline; either way top the pool back up
+        pool_key = _question_pool_key(user_type, num_questions, focus_domains)
+        questions_data = _take_pooled_questions(pool_key) if pool_key else None
+        if questions_data is None:
+            questions_data = _generate_questions(user_type, num_questions, focus_domains)
+        if pool_key:
+            _schedule_question_refill(pool_key)
+        questions_data = _with_unique_assessment_id(questions_data)
+        
+        logger.debug(
+            "Generated assessment %s (%s, %s questions)",
+            questions_data.get('assessment_id'),
+            questions_data.get('assessment_type', user_type),
+            questions_data.get('total_questions')
+        )
+        
+        # Optionally save to database
+        if user_id:
+            if _db_manager:
                 try:
-                    # 6.1: Save evaluation record to appropriate collection
-                    collection_name = (
-                        'mentor_evaluations' if user_type == 'mentor' 
-                        else 'psychometric_evaluations'
-                    )
+                    # Store the assessment for later retrieval
+                    collection_name = _EVAL_DISPATCH[user_type][1]
                     
-                    print(f"\n📝 Step 1: Saving to {collection_name}...")
-                    
-                    evaluation_record = {
+                    assessment_record = {
                         "user_id": user_id,
-                        "user_name": user_name,
                         "user_type": user_type,
-                        "assessment_id": assessment_id,
-                        "evaluation_result": evaluation_result,
-                        "questions_answered": len(responses),
-                        "overall_score": evaluation_result.get(
-                            'overall_score', 
-                            evaluation_result.get('overall_mentor_score')
-                        ),
-                        "completion_rate": evaluation_result.get('completion_rate'),
-                        "evaluated_at": evaluation_result.get('evaluated_at')
+                        "assessment_id": questions_data.get("assessment_id"),
+                        "assessment_type": questions_data.get("assessment_type", user_type),
+                        "questions_data": questions_data,
+                        "status": "pending",
+                        "generated_at": questions_data.get("generated_at")
                     }
                     
-                    result = db_manager.db[collection_name].insert_one(evaluation_record)
-                    evaluation_id = str(result.inserted_id)
-                    print(f"✅ Evaluation saved with ID: {evaluation_id}")
-                    logger.info(f"{user_type.capitalize()} evaluation saved with ID: {evaluation_id}")
-                    
-                    # 6.2: Update assessment status
-                    print(f"\n📝 Step 2: Updating assessment status...")
-                    assessment_collection = (
-                        'mentor_assessments' if user_type == 'mentor' 
-                        else 'psychometric_assessments'
-                    )
-                    
-                    assessment_update_result = db_manager.db[assessment_collection].update_one(
-                        {"assessment_id": assessment_id, "user_id": user_id},
-                        {"$set": {"status": "completed", "evaluation_id": evaluation_id}}
-                    )
-                    print(f"✅ Assessment status updated (matched: {assessment_update_result.matched_count})")
-                    
-                    # 6.3: Update users collection
-                    print(f"\n📝 Step 3: Updating users collection...")
-                    from datetime import datetime, timezone
-                    
-                    overall_score = round(
-                        evaluation_result.get('overall_score', evaluation_result.get('overall_mentor_score', 0)), 
-                        2
+                    # Best-effort record: written on the background pool so the
+                    # response never waits on it; failures surface in the log
+                    _WRITE_POOL.submit(
+                        _db_manager.db[collection_name].insert_one,
+                        assessment_record
+                    ).add_done_callback(_log_write_failure)
+                    logger.info(
+                        f"{user_type.capitalize()} assessment queued for "
+                        f"database for user {user_id}"
                     )
-                    completed_at = datetime.now(timezone.utc)
-                    
-                    print(f" - User ID: {user_id}")
-                    print(f" - User Type: {user_type}")
-                    print(f" - Score (rounded): {overall_score}")
-                    print(f" - Completed At: {completed_at}")
-                    
-                    # Different fields based on user type
-                    if user_type == 'mentor':
-                        update_fields = {
-                            "isPsychometricAnalysisDone": True,
-                            "mentorPsychometricScore": overall_score,
-                            "mentorPsychometricCompletedAt": completed_at,
-                            "mentorTeachingStyle": evaluation_result.get('teaching_style', ''),
-                            "mentorExpertiseDomains": evaluation_result.get('expertise_domains', []),
-                            "mentorCapacity": evaluation_result.get('mentoring_capacity', '')
-                        }
-                        print(f"📝 Using MENTOR-specific fields for users collection")
-                    else:  # entrepreneur
-                        update_fields = {
-                            "isPsychometricAnalysisDone": True,
-                            "psychometricScore": overall_score,
-                            "psychometricCompletedAt": completed_at
-                        }
-                        print(f"📝 Using ENTREPRENEUR-specific fields for users collection")
-                    
-                    user_update_result = db_manager.db.users.update_one(
-                        {"_id": ObjectId(user_id)},
-                        {"$set": update_fields}
-                    )
-                    
-                    if user_update_result.matched_count > 0:
-                        print(f"✅ Users collection updated successfully")
-                        print(f" - Matched: {user_update_result.matched_count}")
-                        print(f" - Modified: {user_update_result.modified_count}")
-                        logger.info(f"✅ Updated users collection for {user_type}: score={overall_score}")
-                    else:
-                        print(f"⚠️ WARNING: User {user_id} not found in users collection")
-                        logger.warning(f"User {user_id} not found in users collection")
-                    
-                    # Verify update
-                    print(f"\n🔍 Verifying user document update...")
-                    updated_user = db_manager.db.users.find_one(
-                        {"_id": ObjectId(user_id)},
-                        {"_id": 1, "name": 1, "email": 1, "role": 1, **{k: 1 for k in update_fields.keys()}}
-                    )
-                    
-                    if updated_user:
-                        print(f"✅ User document verified:")
-                        print(f" - _id: {updated_user.get('_id')}")
-                        print(f" - name: {updated_user.get('name')}")
-                        print(f" - role: {updated_user.get('role')}")
-                        for key in update_fields.keys():
-                            print(f" - {key}: {updated_user.get(key)}")
-                    else:
-                        print(f"⚠️ Could not verify - user not found")
-                
                 except Exception as e:
-                    print(f"\n❌ ERROR saving to database: {e}")
-                    logger.warning(f"Failed to save evaluation to DB: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            # Step 7: Create/update user profile
-            print(f"\n👤 Creating/updating {user_type} profile...")
-            profile_manager = get_user_profile_manager()
-            user_profile = None
-            
-            try:
-                user_profile = profile_manager.create_profile_from_psychometric(
-                    user_id=user_id,
-                    evaluation_result=evaluation_result,
-                    user_type=user_type  # Pass user type to profile manager
-                )
-                print(f"✅ {user_type.capitalize()} profile created/updated successfully")
-                logger.info(f"{user_type.capitalize()} profile created/updated for: {user_id}")
-            except Exception as e:
-                print(f"⚠️ WARNING: Failed to create {user_type} profile: {e}")
-                logger.warning(f"Failed to create {user_type} profile: {e}")
-            
-            # Step 8: Prepare response
-            print(f"\n📤 Preparing response...")
-            response_data = {
-                "success": True,
-                "evaluation_id": evaluation_id,
-                "user_type": user_type,
-                "assessment_type": user_type,
-                "profile_created": user_profile is not None,
-                **evaluation_result
-            }
-            
-            print(f"\n✅ {user_type.upper()} EVALUATION COMPLETE")
-            print(f" - Overall Score: {evaluation_result.get('overall_score', evaluation_result.get('overall_mentor_score'))}/10")
-            print(f" - Evaluation ID: {evaluation_id}")
-            print(f" - Profile Created: {user_profile is not None}")
-            print("="*70 + "\n")
-            
-            logger.info(f"{user_type.capitalize()} evaluation complete.")
-            
-            return jsonify(response_data)
+                    logger.warning(f"Failed to queue assessment save: {e}")
         
-        except Exception as e:
-            print(f"\n❌ FATAL ERROR in evaluate_psychometric_responses:")
-            print(f" Error Type: {type(e).__name__}")
-            print(f" Error Message: {str(e)}")
-            logger.error(f"Failed to evaluate responses: {e}")
-            import traceback
-            print("\n📚 Full Traceback:")
-            traceback.print_exc()
+        return jsonify({
+            "success": True,
+            "assessment_id": questions_data.get("assessment_id"),
+            "assessment_type": user_type,
+            "title": questions_data.get("title"),
+            "description": questions_data.get("description"),
+            "estimated_time_minutes": questions_data.get("estimated_time_minutes"),
+            "total_questions": questions_data.get("total_questions"),
+            "questions": questions_data.get("questions"),
+            "generated_at": questions_data.get("generated_at")
+        })
+    
+    except Exception as e:
+        logger.exception(f"Failed to generate assessment: {e}")
+        return jsonify({
+            "error": "Failed to generate assessment",
+            "details": str(e)
+        }), 500
+
+
+def evaluate_psychometric_responses():
+    """
+    Evaluate psychometric assessment responses (entrepreneur or mentor)
+    """
+    try:
+        # Step 1: Parse request data
+        data = request.get_json()
+        
+        if not data:
             return jsonify({
-                "error": "Failed to evaluate responses",
-                "details": str(e)
-            }), 500
+                "error": "Invalid request",
+                "message": "Request body is required"
+            }), 400
+        
+        # Extract user_id first and parse it once for every users query
+        user_id = data.get('user_id', 'anonymous')
+        try:
+            user_oid = _parse_user_oid(user_id)
+        except (InvalidId, TypeError):
+            return _invalid_user_id_response()
+        
+        # Step 2: Determine user type (now with database lookup)
+        user_type = _determine_user_type_cached(data, user_id=user_id, user_oid=user_oid)
+        if not _evaluators.get(user_type):
+            return _service_unavailable_response("Evaluator")
+        
+        # Steps 3-4: Validate required fields and resolve the questions
+        questions_data, error = _resolve_evaluation_input(data, user_type, user_id)
+        if error:
+            return jsonify(error[0]), error[1]
+        
+        responses = data['responses']
+        
+        user_name = data.get('user_name', 'Anonymous User')
+        assessment_id = data.get('assessment_id', questions_data.get('assessment_id', 'unknown'))
+        mentor_background = data.get('mentor_background', None)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Evaluate request: user_id=%s user_name=%s user_type=%s assessment_id=%s "
+                "total_questions=%s first_responses=%s",
+                user_id, user_name, user_type, assessment_id,
+                questions_data.get('total_questions', 0), list(responses.keys())[:5]
+            )
+        
+        logger.info(f"Evaluating {user_type} psychometric responses for user: {user_id}")
+        logger.info(f"Received {len(responses)} responses")
+        
+        # Step 5: Route to appropriate evaluator (mentors also pass background)
+        extra_args = (mentor_background,) if user_type == 'mentor' else ()
+        evaluation_result = _evaluators[user_type].evaluate_responses(
+            questions_data,
+            responses,
+            *extra_args
+        )
+        
+        logger.debug(
+            "Evaluation scored: overall=%s completion=%s%%",
+            evaluation_result.get('overall_score', evaluation_result.get('overall_mentor_score')),
+            evaluation_result.get('completion_rate')
+        )
+        
+        # Steps 6-7: add user information, then persist evaluation, status
+        # updates and profile off the request thread; the id is allocated
+        # here so the client gets it now
+        entry = _prepare_evaluation_persist(
+            evaluation_result, user_id, user_oid, user_name, user_type,
+            assessment_id, len(responses)
+        )
+        _queue_evaluations_persist(user_type, [entry])
+        evaluation_id = str(entry[0])
+        
+        # Step 8: Prepare response
+        response_data = {
+            "success": True,
+            "evaluation_id": evaluation_id,
+            "user_type": user_type,
+            "assessment_type": user_type,
+            # The profile is written after the response, so both keys only
+            # say whether that write was scheduled; profile_created is kept
+            # for existing clients
+            "profile_created": _profile_manager is not None,
+            "profile_update_queued": _profile_manager is not None,
+            **evaluation_result
+        }
+        
+        logger.info(f"{user_type.capitalize()} evaluation complete.")
+        
+        return jsonify(response_data)
     
+    except Exception as e:
+        logger.exception(f"Failed to evaluate responses: {e}")
+        return jsonify({
+            "error": "Failed to evaluate responses",
+            "details": str(e)
+        }), 500
+
+
+def evaluate_psychometric_responses_batch():
+    """
+    Evaluate a cohort of assessment submissions in one request
     
-    @app.route('/api/psychometric/evaluations/<user_id>', methods=['GET'])
-    def get_user_evaluations(user_id):
-        """Get all psychometric evaluations for a user (both types)"""
-        try:
-            db_manager = get_database_manager()
-            if not db_manager:
-                return jsonify({"error": "Database not available"}), 503
-            
-            limit = request.args.get('limit', 10, type=int)
-            user_type_filter = request.args.get('user_type', 'all').lower()
-            
-            evaluations = []
-            
-            # Fetch entrepreneur evaluations
-            if user_type_filter in ['all', 'entrepreneur']:
-                entrepreneur_evals = list(
-                    db_manager.db.psychometric_evaluations
-                    .find({"user_id": user_id})
-                    .sort("evaluated_at", -1)
-                    .limit(limit)
-                )
-                for eval in entrepreneur_evals:
-                    eval['_id'] = str(eval['_id'])
-                    eval['type'] = 'entrepreneur'
-                evaluations.extend(entrepreneur_evals)
-            
-            # Fetch mentor evaluations
-            if user_type_filter in ['all', 'mentor']:
-                mentor_evals = list(
-                    db_manager.db.mentor_evaluations
-                    .find({"user_id": user_id})
-                    .sort("evaluated_at", -1)
-                    .limit(limit)
-                )
-                for eval in mentor_evals:
-                    eval['_id'] = str(eval['_id'])
-                    eval['type'] = 'mentor'
-                evaluations.extend(mentor_evals)
-            
-            # Sort combined results by date
-            evaluations.sort(key=lambda x: x.get('evaluated_at', ''), reverse=True)
-            evaluations = evaluations[:limit]
-            
-            types = list(set(eval.get('type') for eval in evaluations))
-            
+    Each item is validated like a single /evaluate body. Valid items are
+    grouped by user type and scored together, with their analysis LLM
+    calls batched; invalid items get a per-item error instead of failing
+    the whole request.
+    
+    Request Body:
+    {
+        "evaluations": [
+            {"user_id": "...", "user_name": "...", "responses": {...},
+             "questions_data": {...} | "assessment_id": "..."},
+            ...
+        ]
+    }
+    """
+    try:
+        data = request.get_json()
+        items = data.get('evaluations') if isinstance(data, dict) else None
+        
+        if not isinstance(items, list) or not items:
             return jsonify({
-                "user_id": user_id,
-                "evaluations": evaluations,
-                "count": len(evaluations),
-                "types": types
-            })
+                "error": "Invalid request",
+                "message": "evaluations must be a non-empty list"
+            }), 400
         
-        except Exception as e:
-            logger.error(f"Failed to get user evaluations: {e}")
+        if len(items) > _MAX_EVALUATION_BATCH:
             return jsonify({
-                "error": "Failed to retrieve evaluations",
-                "details": str(e)
-            }), 500
-    
-    
-    @app.route('/api/psychometric/evaluation/<evaluation_id>', methods=['GET'])
-    def get_evaluation_by_id(evaluation_id):
-        """Get specific evaluation by ID (checks both collections)"""
-        try:
-            db_manager = get_database_manager()
-            if not db_manager:
-                return jsonify({"error": "Database not available"}), 503
-            
-            from bson import ObjectId
+                "error": "Batch too large",
+                "max_batch": _MAX_EVALUATION_BATCH
+            }), 400
+        
+        results = [None] * len(items)
+        # Per user type: [(position, user_id, user_oid, questions_data, item)]
+        groups = {}
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                results[position] = {"success": False, "error": "Invalid request"}
+                continue
             
-            # Try entrepreneur evaluations first
-            evaluation = db_manager.db.psychometric_evaluations.find_one(
-                {"_id": ObjectId(evaluation_id)}
-            )
+            user_id = item.get('user_id', 'anonymous')
+            try:
+                user_oid = _parse_user_oid(user_id)
+            except (InvalidId, TypeError):
+                results[position] = {"success": False, "error": "Invalid user ID format"}
+                continue
             
-            if evaluation:
-                evaluation['_id'] = str(evaluation['_id'])
-                evaluation['type'] = 'entrepreneur'
-                return jsonify(evaluation)
+            # Not the flask.g memo: it is keyed by user_id alone, and items
+            # sharing a user_id (or anonymous) may carry different roles
+            user_type = _determine_user_type(item, user_id=user_id, user_oid=user_oid)
+            questions_data, error = _resolve_evaluation_input(item, user_type, user_id)
+            if error:
+                results[position] = {"success": False, **error[0]}
+                continue
             
-            # Try mentor evaluations
-            evaluation = db_manager.db.mentor_evaluations.find_one(
-                {"_id": ObjectId(evaluation_id)}
+            groups.setdefault(user_type, []).append(
+                (position, user_id, user_oid, questions_data, item)
             )
+        
+        logger.info(
+            f"Evaluating a batch of {len(items)} submissions "
+            f"({sum(len(group) for group in groups.values())} valid)"
+        )
+        
+        for user_type, group in groups.items():
+            if not _evaluators.get(user_type):
+                for position, *_ in group:
+                    results[position] = {"success": False, "error": "Evaluator not available"}
+                continue
             
-            if evaluation:
-                evaluation['_id'] = str(evaluation['_id'])
-                evaluation['type'] = 'mentor'
-                return jsonify(evaluation)
+            # Mentors also pass background, as on the single endpoint
+            if user_type == 'mentor':
+                batch_items = [
+                    (questions_data, item['responses'], item.get('mentor_background'))
+                    for _, _, _, questions_data, item in group
+                ]
+            else:
+                batch_items = [
+                    (questions_data, item['responses'])
+                    for _, _, _, questions_data, item in group
+                ]
+            # A failing group only fails its own items; groups already
+            # evaluated (and queued for persistence) keep their results
+            try:
+                evaluation_results = _evaluators[user_type].evaluate_responses_batch(batch_items)
+            except Exception as e:
+                logger.exception(f"Failed to evaluate {user_type} batch group: {e}")
+                for position, *_ in group:
+                    results[position] = {
+                        "success": False,
+                        "error": "Failed to evaluate responses",
+                        "details": str(e)
+                    }
+                continue
             
-            return jsonify({"error": "Evaluation not found"}), 404
+            # The whole group is persisted by one background job
+            entries = []
+            for (position, user_id, user_oid, questions_data, item), evaluation_result in zip(
+                group, evaluation_results
+            ):
+                entry = _prepare_evaluation_persist(
+                    evaluation_result,
+                    user_id,
+                    user_oid,
+                    item.get('user_name', 'Anonymous User'),
+                    user_type,
+                    item.get('assessment_id', questions_data.get('assessment_id', 'unknown')),
+                    len(item['responses'])
+                )
+                entries.append(entry)
+                results[position] = {
+                    "success": True,
+                    "evaluation_id": str(entry[0]),
+                    "user_type": user_type,
+                    "assessment_type": user_type,
+                    "profile_created": _profile_manager is not None,
+                    "profile_update_queued": _profile_manager is not None,
+                    **evaluation_result
+                }
+            _queue_evaluations_persist(user_type, entries)
         
-        except Exception as e:
-            logger.error(f"Failed to get evaluation: {e}")
-            return jsonify({
-                "error": "Failed to retrieve evaluation",
-                "details": str(e)
-            }), 500
+        return jsonify({
+            "success": True,
+            "total": len(items),
+            "evaluated": sum(1 for result in results if result["success"]),
+            "results": results
+        })
+    
+    except Exception as e:
+        logger.exception(f"Failed to evaluate response batch: {e}")
+        return jsonify({
+            "error": "Failed to evaluate responses",
+            "details": str(e)
+        }), 500
+
+
+def _stream_evaluations_page(cursor, user_id: str, skip: int, limit: int):
+    """
+    Yield the evaluation history body one document at a time
     
+    Documents are encoded as they come off the cursor instead of being
+    collected first; the totals that depend on the whole page (count,
+    types, next_skip) follow the list. The cursor holds up to limit + 1
+    documents, the extra one only signalling that a further page exists.
+    """
+    yield b'{"user_id":' + orjson.dumps(user_id) + b',"evaluations":['
+    count = 0
+    types = set()
+    has_more = False
+    try:
+        for evaluation in cursor:
+            if count == limit:
+                has_more = True
+                break
+            # _id arrives as a string; default=str covers any nested ObjectIds
+            yield (b',' if count else b'') + orjson.dumps(evaluation, default=str)
+            types.add(evaluation.get('type'))
+            count += 1
+    except Exception as e:
+        # Headers are already sent; end the body with what was read
+        logger.error(f"Evaluation history stream failed after {count} documents: {e}")
+    finally:
+        close = getattr(cursor, 'close', None)
+        if close:
+            close()
+    
+    tail = orjson.dumps({
+        "count": count,
+        "types": list(types),
+        "skip": skip,
+        "limit": limit,
+        "next_skip": skip + limit if has_more else None
+    })
+    yield b'],' + tail[1:]
+
+
+def get_user_evaluations(user_id):
+    """Get all psychometric evaluations for a user (both types)"""
+    try:
+        if not _db_manager:
+            return jsonify({"error": "Database not available"}), 503
+        
+        limit = max(1, min(request.args.get('limit', 10, type=int), _MAX_EVALUATION_PAGE))
+        skip = max(0, request.args.get('skip', 0, type=int))
+        user_type_filter = request.args.get('user_type', 'all').lower()
+        
+        # One aggregation over both collections: each branch takes its own
+        # newest skip+limit+1 rows off the (user_id, evaluated_at) index,
+        # then the union is sorted and paged server-side (the extra row
+        # tells us whether a further page exists)
+        window = skip + limit + 1
+        branches = [
+            (collection, [
+                {"$match": {"user_id": user_id}},
+                {"$sort": {"evaluated_at": -1}},
+                {"$limit": window},
+                {"$project": _EVALUATION_LIST_PROJECTION},
+                {"$addFields": {"type": eval_type}}
+            ])
+            for collection, eval_type in _EVALUATION_COLLECTIONS
+            if user_type_filter in ('all', eval_type)
+        ]
+        
+        cursor = ()
+        if branches:
+            (base_collection, pipeline), *others = branches
+            for collection, branch in others:
+                pipeline.append({"$unionWith": {"coll": collection, "pipeline": branch}})
+            if others:
+                pipeline.append({"$sort": {"evaluated_at": -1}})
+            pipeline += [
+                {"$skip": skip},
+                {"$limit": limit + 1},
+                {"$addFields": {"_id": {"$toString": "$_id"}}}
+            ]
+            # Whole page in the first batch: one round trip, no getMore.
+            # Run here, so query errors still get the 500 below
+            cursor = _db_manager.db[base_collection].aggregate(pipeline, batchSize=limit + 1)
+        
+        return Response(
+            stream_with_context(_stream_evaluations_page(cursor, user_id, skip, limit)),
+            mimetype="application/json"
+        )
     
-    @app.route('/api/profile/<user_id>', methods=['GET'])
-    def get_user_profile(user_id):
-        """Get user profile (entrepreneur or mentor or both)"""
+    except Exception as e:
+        logger.error(f"Failed to get user evaluations: {e}")
+        return jsonify({
+            "error": "Failed to retrieve evaluations",
+            "details": str(e)
+        }), 500
+
+
+def get_evaluation_by_id(evaluation_id):
+    """Get specific evaluation by ID (checks both collections)"""
+    try:
+        if not _db_manager:
+            return jsonify({"error": "Database not available"}), 503
+        
         try:
-            profile_type = request.args.get('profile_type', 'all').lower()
-            profile_manager = get_user_profile_manager()
-            
-            response_data = {"user_id": user_id, "profile_types": []}
-            
-            # Get entrepreneur profile
-            if profile_type in ['all', 'entrepreneur']:
-                entrepreneur_profile = profile_manager.get_profile(user_id, user_type='entrepreneur')
-                if entrepreneur_profile:
-                    response_data['entrepreneur_profile'] = entrepreneur_profile
-                    response_data['profile_types'].append('entrepreneur')
-            
-            # Get mentor profile
-            if profile_type in ['all', 'mentor']:
-                mentor_profile = profile_manager.get_profile(user_id, user_type='mentor')
-                if mentor_profile:
-                    response_data['mentor_profile'] = mentor_profile
-                    response_data['profile_types'].append('mentor')
-            
-            if not response_data['profile_types']:
-                return jsonify({
-                    "error": "Profile not found",
-                    "message": "User needs to complete psychometric assessment first"
-                }), 404
-            
-            return jsonify(response_data)
+            evaluation_oid = ObjectId(evaluation_id)
+        except (InvalidId, TypeError):
+            return jsonify({"error": "Invalid evaluation_id"}), 400
         
-        except Exception as e:
-            logger.error(f"Failed to get profile: {e}")
+        # Probe both collections in one round trip; ids are unique across
+        # them, so at most one document comes back
+        (base_collection, base_type), *others = _EVALUATION_COLLECTIONS
+        pipeline = [
+            {"$match": {"_id": evaluation_oid}},
+            {"$addFields": {"type": base_type}}
+        ]
+        for collection, eval_type in others:
+            pipeline.append({"$unionWith": {"coll": collection, "pipeline": [
+                {"$match": {"_id": evaluation_oid}},
+                {"$addFields": {"type": eval_type}}
+            ]}})
+        pipeline.append({"$limit": 1})
+        
+        evaluation = next(_db_manager.db[base_collection].aggregate(pipeline), None)
+        if evaluation:
+            return jsonify(evaluation)
+        
+        return jsonify({"error": "Evaluation not found"}), 404
+    
+    except Exception as e:
+        logger.error(f"Failed to get evaluation: {e}")
+        return jsonify({
+            "error": "Failed to retrieve evaluation",
+            "details": str(e)
+        }), 500
+
+
+def get_user_profile(user_id):
+    """Get user profile (entrepreneur or mentor or both)"""
+    try:
+        if not _profile_manager:
+            return _service_unavailable_response("Profile manager")
+        
+        profile_type = request.args.get('profile_type', 'all').lower()
+        
+        body = _get_cached_profile_body(user_id, profile_type)
+        if body is not None:
+            return _etag_response(body)
+        
+        response_data = {"user_id": user_id, "profile_types": []}
+        
+        # Both profiles are independent reads; overlap them when both are wanted
+        mentor_future = None
+        if profile_type == 'all':
+            mentor_future = _PROFILE_POOL.submit(
+                _profile_manager.get_profile, user_id, user_type='mentor'
+            )
+        
+        # Get entrepreneur profile
+        if profile_type in ['all', 'entrepreneur']:
+            entrepreneur_profile = _profile_manager.get_profile(user_id, user_type='entrepreneur')
+            if entrepreneur_profile:
+                response_data['entrepreneur_profile'] = entrepreneur_profile
+                response_data['profile_types'].append('entrepreneur')
+        
+        # Get mentor profile
+        if profile_type in ['all', 'mentor']:
+            mentor_profile = (
+                mentor_future.result() if mentor_future
+                else _profile_manager.get_profile(user_id, user_type='mentor')
+            )
+            if mentor_profile:
+                response_data['mentor_profile'] = mentor_profile
+                response_data['profile_types'].append('mentor')
+        
+        if not response_data['profile_types']:
             return jsonify({
-                "error": "Failed to retrieve profile",
-                "details": str(e)
-            }), 500
+                "error": "Profile not found",
+                "message": "User needs to complete psychometric assessment first"
+            }), 404
+        
+        body = orjson.dumps(response_data, default=str)
+        _store_profile_body(user_id, profile_type, body)
+        return _etag_response(body)
+    
+    except Exception as e:
+        logger.error(f"Failed to get profile: {e}")
+        return jsonify({
+            "error": "Failed to retrieve profile",
+            "details": str(e)
+        }), 500
+
+
+def get_validation_context(user_id):
+    """Get personalized validation context for a user"""
+    try:
+        body = _get_cached_profile_body(user_id, "validation-context")
+        if body is None:
+            if not _profile_manager:
+                return _service_unavailable_response("Profile manager")
+            context = _profile_manager.get_personalized_validation_context(user_id)
+            body = orjson.dumps(context, default=str)
+            _store_profile_body(user_id, "validation-context", body)
+        return _etag_response(body)
     
+    except Exception as e:
+        logger.error(f"Failed to get validation context: {e}")
+        return jsonify({
+            "error": "Failed to retrieve validation context",
+            "details": str(e)
+        }), 500
+
+
+def register_psychometric_endpoints(app):
+    """Register unified psychometric assessment endpoints with Flask app"""
+    global _db_manager, _profile_manager
     
-    @app.route('/api/profile/<user_id>/validation-context', methods=['GET'])
-    def get_validation_context(user_id):
-        """Get personalized validation context for a user"""
+    # Resolve the process-wide singletons once for the module-level handlers.
+    # A failed dependency is bound as None so the app still starts and the
+    # affected routes answer 503
+    for user_type, (getter, _, _) in _EVAL_DISPATCH.items():
         try:
-            profile_manager = get_user_profile_manager()
-            context = profile_manager.get_personalized_validation_context(user_id)
-            return jsonify(context)
-        
+            _evaluators[user_type] = getter()
         except Exception as e:
-            logger.error(f"Failed to get validation context: {e}")
-            return jsonify({
-                "error": "Failed to retrieve validation context",
-                "details": str(e)
-            }), 500
+            _evaluators[user_type] = None
+            logger.error(f"{user_type.capitalize()} evaluator unavailable: {e}")
+    
+    try:
+        _db_manager = get_database_manager()
+    except Exception as e:
+        _db_manager = None
+        logger.error(f"Database manager unavailable: {e}")
+    
+    try:
+        _profile_manager = get_user_profile_manager()
+        # History flushes and other profile writes also stale the bodies
+        _profile_manager.add_invalidation_listener(_invalidate_profile_bodies)
+    except Exception as e:
+        _profile_manager = None
+        logger.error(f"Profile manager unavailable: {e}")
+    
+    app.add_url_rule(
+        '/api/psychometric/generate',
+        view_func=generate_psychometric_assessment,
+        methods=['POST']
+    )
+    app.add_url_rule(
+        '/api/psychometric/evaluate',
+        view_func=evaluate_psychometric_responses,
+        methods=['POST']
+    )
+    app.add_url_rule(
+        '/api/psychometric/evaluate/batch',
+        view_func=evaluate_psychometric_responses_batch,
+        methods=['POST']
+    )
+    app.add_url_rule(
+        '/api/psychometric/evaluations/<user_id>',
+        view_func=get_user_evaluations,
+        methods=['GET']
+    )
+    app.add_url_rule(
+        '/api/psychometric/evaluation/<evaluation_id>',
+        view_func=get_evaluation_by_id,
+        methods=['GET']
+    )
+    app.add_url_rule(
+        '/api/profile/<user_id>',
+        view_func=get_user_profile,
+        methods=['GET']
+    )
+    app.add_url_rule(
+        '/api/profile/<user_id>/validation-context',
+        view_func=get_validation_context,
+        methods=['GET']
+    )
     
     logger.info("Psychometric endpoints registered")
@@ -4,19 +4,190 @@ Psychometric Evaluation Module
 Generates dynamic psychometric questions and analyzes responses
 """
 
+import io
 import os
+import copy
+import functools
 import logging
-import json
-import re
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import Future
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
+from types import MappingProxyType
+import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import SystemMessage
+from langchain_core.prompt_values import PromptValue
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
-from tenacity import retry, wait_exponential, stop_after_attempt
+from pydantic import BaseModel, ValidationError
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
+
+from .mentor_evaluator import AnsweredQuestion
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Retry only transient transport/rate-limit/5xx errors, with jitter so 429
+# bursts don't retry in lockstep. No new attempt starts after 60s; an
+# attempt already in flight still runs up to the client timeout
+_LLM_RETRY = {
+    "retry": retry_if_exception_type(
+        (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    ),
+    "wait": wait_random_exponential(multiplier=1, max=20),
+    "stop": stop_after_attempt(4) | stop_after_delay(60),
+    "reraise": True,
+}
+
+
+@functools.lru_cache(maxsize=2)
+def _minute_stamp(minute: datetime) -> str:
+    """assessment_id timestamp for a minute-truncated datetime"""
+    return minute.strftime('%Y%m%d_%H%M')
+
+
+# Static part of the fallback analysis; the profile summary is filled per call
+_FALLBACK_ANALYSIS_TEMPLATE = MappingProxyType({
+    "strengths": ["Assessment completed successfully"],
+    "areas_for_development": ["Review detailed scores for specific insights"],
+    "entrepreneurial_fit": {
+        "overall_fit": "Medium",
+        "fit_score": 70,
+        "reasoning": "Assessment completed. Individual results vary by dimension.",
+        "ideal_role": "Entrepreneur",
+        "ideal_venture_type": "Versatile"
+    },
+    "recommendations": [
+        "Review dimension scores in detail",
+        "Focus on top 2-3 development areas",
+        "Consider coaching for targeted growth"
+    ],
+    "detailed_insights": {
+        "leadership_style": "Further analysis needed",
+        "decision_making_pattern": "Review response patterns",
+        "stress_response": "Self-assessment recommended",
+        "growth_potential": "Moderate to high",
+        "team_dynamics": "Context-dependent",
+        "unique_qualities": "Individual strengths identified"
+    }
+})
+
+# ijson events allowed at an object / array position of the question document
+_OBJECT_EVENTS = frozenset({"start_map", "map_key", "end_map"})
+_ARRAY_EVENTS = frozenset({"start_array", "end_array"})
+
+# Connection pool for the OpenAI HTTP clients
+_LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Upper bound on output tokens for any single LLM call; question calls pass a
+# budget sized to the question count and analysis calls a fixed small one
+_MAX_OUTPUT_TOKENS = 16000
+_ANALYSIS_MAX_TOKENS = 1500
+
+# Upper bound on parallel LLM calls in the batch evaluation path
+_LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+
+
+class _LLMJsonStream(io.RawIOBase):
+    """
+    Readable byte stream over streamed LLM text chunks
+
+    Skips anything before the first '{' (e.g. a ```json fence) and ends the
+    stream once that top-level object closes, so trailing fences or prose
+    never reach the JSON parser.
+    """
+
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._buffer = b""
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _take(self, text: str) -> str:
+        """Return the part of `text` that belongs to the top-level object"""
+        start = 0
+        if not self._started:
+            start = text.find("{")
+            if start < 0:
+                return ""
+            self._started = True
+
+        for i in range(start, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    return text[start:i + 1]
+        return text[start:]
+
+    def readinto(self, b) -> int:
+        while not self._buffer and not self._done:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer = self._take(chunk).encode()
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class OptionModel(BaseModel):
+    """Schema of one answer option in a generated question set"""
+    option_id: str
+    text: str
+    score_profile: Dict[str, float]
+
+
+class QuestionModel(BaseModel):
+    """Schema of one generated question"""
+    question_id: str
+    question_text: str
+    dimension: Optional[str] = None
+    options: List[OptionModel]
+
+
+class AssessmentModel(BaseModel):
+    """Schema of a generated question set; validation only, the dict is kept"""
+    assessment_id: str
+    title: str
+    questions: List[QuestionModel]
+
 
 class PsychometricEvaluator:
     """
@@ -68,8 +239,104 @@ class PsychometricEvaluator:
         }
     }
 
+    # Position of each dimension, for index-based accumulation
+    _DIM_INDEX = {dim: i for i, dim in enumerate(DIMENSIONS)}
+
+    # Dimension summary for the analysis prompt, filled per call with
+    # str.format(**dimension_scores); fixed dimension order
+    _DIMENSION_DETAILS_FMT = "\n".join(
+        f"- {info['name']}: {{{dim}}}/10" for dim, info in DIMENSIONS.items()
+    )
+
+    # Invariant part of the question prompt, kept byte-identical across calls
+    # so the provider's prompt-prefix cache can reuse it
+    _QUESTION_PROMPT_HEADER = """Generate psychometric questions for entrepreneurs.
+
+STRICT REQUIREMENTS:
+1. Return ONLY valid JSON - no markdown, no explanations, no comments
+2. Use double quotes for all keys and string values
+3. Ensure no trailing commas in arrays or objects
+4. Cover ALL 10 dimensions evenly
+5. Make options realistic and psychologically nuanced
+6. Generate exactly the number of questions given in the request
+7. Use the assessment_id and estimated_time_minutes given in the request
+
+Return this JSON structure:
+{
+  "assessment_id": "<assessment_id from the request>",
+  "title": "Entrepreneurial Psychometric Assessment",
+  "description": "Comprehensive evaluation of entrepreneurial traits and competencies",
+  "estimated_time_minutes": <estimated_time_minutes from the request>,
+  "questions": [
+    {
+      "question_id": "q1",
+      "dimension": "leadership",
+      "question_text": "When facing a critical business decision with incomplete information, you typically...",
+      "question_type": "situational",
+      "options": [
+        {
+          "option_id": "A",
+          "text": "Make a decisive choice based on intuition and available data",
+          "score_profile": {"leadership": 8, "decision_making": 8, "risk_tolerance": 6}
+        },
+        {
+          "option_id": "B",
+          "text": "Consult key stakeholders to build consensus before deciding",
+          "score_profile": {"leadership": 7, "emotional_intelligence": 8, "communication": 7}
+        }
+      ]
+    }
+  ]
+}"""
+
+    # Invariant part of the analysis prompt; the scores are appended after it
+    _ANALYSIS_PROMPT_HEADER = """Analyze this entrepreneur assessment and return ONLY valid JSON.
+
+Return EXACT JSON structure:
+{
+  "personality_profile": "Concise 2-3 sentence summary of entrepreneurial personality",
+  "strengths": ["Top strength 1", "Top strength 2", "Top strength 3"],
+  "areas_for_development": ["Development area 1", "Development area 2"],
+  "entrepreneurial_fit": {
+    "overall_fit": "High/Medium/Low",
+    "fit_score": 0-100,
+    "reasoning": "Brief explanation of fit assessment",
+    "ideal_role": "Founder/Co-founder/Intrapreneur/Advisor",
+    "ideal_venture_type": "Tech startup/Small business/Social enterprise/Corporate venture"
+  },
+  "recommendations": ["Actionable recommendation 1", "Recommendation 2", "Recommendation 3"],
+  "detailed_insights": {
+    "leadership_style": "Analysis of leadership approach",
+    "decision_making_pattern": "Decision-making tendencies",
+    "stress_response": "How handles pressure",
+    "growth_potential": "Development outlook",
+    "team_dynamics": "Team interaction style",
+    "unique_qualities": "Distinctive strengths"
+  }
+}
+
+Be specific, professional, and actionable. NO MARKDOWN, NO EXTRA TEXT."""
+
+    # Chat templates: the static header is a fixed system message (not
+    # templated, so its JSON braces need no escaping) and only the short
+    # per-request block is filled in as the user message
+    _QUESTION_PROMPT = ChatPromptTemplate.from_messages([
+        SystemMessage(content=_QUESTION_PROMPT_HEADER),
+        ("human", "{request}")
+    ])
+    _ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+        SystemMessage(content=_ANALYSIS_PROMPT_HEADER),
+        ("human", "{request}")
+    ])
+
+    _dotenv_loaded = False
+
     def __init__(self, model: str = "gpt-4o-mini", timeout: int = 180):
         """Initialize the psychometric evaluator with config validation"""
+        if not PsychometricEvaluator._dotenv_loaded:
+            load_dotenv()
+            PsychometricEvaluator._dotenv_loaded = True
+
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError(
@@ -82,30 +349,62 @@ class PsychometricEvaluator:
             model=model,
             temperature=0.7,
             api_key=api_key,
-            max_tokens=16000,
-            timeout=timeout
+            max_tokens=_MAX_OUTPUT_TOKENS,  # Ceiling; each call passes a smaller budget
+            timeout=timeout,
+            # Pooled keep-alive HTTP/2 connections shared by every request
+            # thread, so calls skip TLS setup
+            http_client=httpx.Client(limits=_LLM_HTTP_LIMITS, http2=True)
         )
+        # In-flight generations by question count; concurrent requests for
+        # the same size share one LLM call instead of issuing their own
+        self._inflight: Dict[int, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Successful analyses keyed by the rounded dimension vector; identical
+        # score profiles reuse the analysis instead of paying for another call
+        self._analysis_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+        self._analysis_cache_lock = threading.Lock()
         logger.info(f"Psychometric Evaluator initialized with {model}")
 
     @staticmethod
     def _clean_json_response(content: str) -> str:
-        """Extract JSON from markdown-wrapped responses using regex"""
-        # Match content between ```json ... ``` or ``` ... ```
-        match = re.search(r'```(?:json\s*)?(.*?)```', content, re.DOTALL)
-        if match:
-            return match.group(1).strip()
-        return content
-
-    @retry(wait=wait_exponential(min=1, max=30), stop=stop_after_attempt(3))
-    def _call_llm_with_retry(self, prompt: str) -> str:
+        """Extract JSON from markdown-wrapped responses"""
+        # Content between the first ```json ... ``` or ``` ... ``` pair;
+        # plain str.find slicing, no regex engine on the hot path
+        start = content.find("```")
+        if start == -1:
+            return content
+        end = content.find("```", start + 3)
+        if end == -1:
+            return content
+        body = content[start + 3:end]
+        if body.startswith("json"):
+            body = body[4:]
+        return body.strip()
+
+    @retry(**_LLM_RETRY)
+    def _call_llm_with_retry(self, prompt: LanguageModelInput, **llm_kwargs: Any) -> str:
         """Call LLM with exponential backoff retry logic"""
-        response = self.llm.invoke(prompt)
+        try:
+            response = self.llm.invoke(prompt, **llm_kwargs)
+        except BadRequestError as e:
+            # Deterministic (bad prompt, context too long): never worth retrying
+            raise ValueError(f"Prompt rejected: {e}") from e
         return response.content
 
+    @staticmethod
+    def _question_token_budget(num_questions: int) -> int:
+        """Output token budget for a question bank (~300 tokens per question)"""
+        return min(_MAX_OUTPUT_TOKENS, 300 * num_questions + 500)
+
     def generate_questions(self, num_questions: int = 20) -> Dict[str, Any]:
         """
         Generate dynamic psychometric questions with validated JSON output
         
+        Concurrent calls for the same num_questions are coalesced: the first
+        caller runs the LLM call and the others wait for it and receive
+        their own copy of the result, restamped with its own assessment_id
+        and generated_at.
+        
         Args:
             num_questions: Number of questions to generate (default: 20)
             
@@ -115,81 +414,145 @@ class PsychometricEvaluator:
         Raises:
             ValueError: If JSON is invalid or required keys are missing
         """
-        try:
-            logger.info(f"Generating {num_questions} psychometric questions...")
-
-            prompt = f"""Generate exactly {num_questions} psychometric questions for entrepreneurs.
-
-STRICT REQUIREMENTS:
-1. Return ONLY valid JSON - no markdown, no explanations, no comments
-2. Use double quotes for all keys and string values
-3. Ensure no trailing commas in arrays or objects
-4. Cover ALL 10 dimensions evenly
-5. Make options realistic and psychologically nuanced
+        with self._inflight_lock:
+            future = self._inflight.get(num_questions)
+            leader = future is None
+            if leader:
+                future = self._inflight[num_questions] = Future()
+
+        if not leader:
+            logger.info("Joining in-flight generation of %d questions", num_questions)
+            questions_data = copy.deepcopy(future.result())
+            now = datetime.now()
+            questions_data["assessment_id"] = self._assessment_id(num_questions, now)
+            questions_data["generated_at"] = now.isoformat()
+            return questions_data
 
-Return this JSON structure:
-{{
-  "assessment_id": "assess_{num_questions}q_{datetime.now().strftime('%Y%m%d_%H%M')}",
-  "title": "Entrepreneurial Psychometric Assessment",
-  "description": "Comprehensive evaluation of entrepreneurial traits and competencies",
-  "estimated_time_minutes": {max(5, num_questions // 2)},
-  "questions": [
-    {{
-      "question_id": "q1",
-      "dimension": "leadership",
-      "question_text": "When facing a critical business decision with incomplete information, you typically...",
-      "question_type": "situational",
-      "options": [
-        {{
-          "option_id": "A",
-          "text": "Make a decisive choice based on intuition and available data",
-          "score_profile": {{"leadership": 8, "decision_making": 8, "risk_tolerance": 6}}
-        }},
-        {{
-          "option_id": "B",
-          "text": "Consult key stakeholders to build consensus before deciding",
-          "score_profile": {{"leadership": 7, "emotional_intelligence": 8, "communication": 7}}
-        }}
-      ]
-    }}
-  ]
-}}
+        try:
+            questions_data = self._generate_questions_uncoalesced(num_questions)
+            # Followers get copies of a private template, never the leader's dict
+            future.set_result(copy.deepcopy(questions_data))
+            return questions_data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(num_questions, None)
 
-Generate questions now:"""
+    def _generate_questions_uncoalesced(self, num_questions: int) -> Dict[str, Any]:
+        """Run one question generation LLM call and parse the result"""
+        try:
+            logger.info("Generating %d psychometric questions...", num_questions)
+            prompt = self._build_questions_prompt(num_questions)
 
-            # Get response with retry logic
-            raw_response = self._call_llm_with_retry(prompt)
-            cleaned_content = self._clean_json_response(raw_response)
-            
-            # Parse JSON
-            try:
-                questions_data = json.loads(cleaned_content)
-            except json.JSONDecodeError as json_err:
-                logger.error(f"JSON decode failed. Raw content: {raw_response[:500]}...")
-                raise ValueError(f"Invalid JSON from LLM: {json_err}")
-
-            # Validate required schema
-            required_keys = {"assessment_id", "title", "questions"}
-            missing_keys = required_keys - questions_data.keys()
-            if missing_keys:
-                raise ValueError(f"Missing required keys in response: {missing_keys}")
-
-            # Validate questions structure
-            if not isinstance(questions_data.get("questions"), list):
-                raise ValueError("Questions must be a list")
-
-            # Add metadata
-            questions_data["generated_at"] = datetime.now().isoformat()
-            questions_data["total_questions"] = len(questions_data["questions"])
-            questions_data["schema_version"] = "1.0"
-
-            logger.info(f"Successfully generated {questions_data['total_questions']} questions")
-            return questions_data
+            # Streamed and validated as it arrives, with retry logic
+            return self._finalize_questions(self._stream_questions_document(
+                prompt, max_tokens=self._question_token_budget(num_questions)
+            ))
 
         except Exception as e:
             logger.error(f"Question generation failed: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _assessment_id(num_questions: int, now: datetime) -> str:
+        """Minute-stamped assessment id for a question bank"""
+        return f"assess_{num_questions}q_{_minute_stamp(now.replace(second=0, microsecond=0))}"
+
+    def _build_questions_prompt(self, num_questions: int) -> PromptValue:
+        """Build the question generation prompt: static system header, per-request details last"""
+        assessment_id = self._assessment_id(num_questions, datetime.now())
+        return self._QUESTION_PROMPT.invoke({"request": (
+            "REQUEST:\n"
+            f"- Generate exactly {num_questions} questions\n"
+            f"- assessment_id: \"{assessment_id}\"\n"
+            f"- estimated_time_minutes: {max(5, num_questions // 2)}\n\n"
+            "Generate questions now:"
+        )})
+
+    @retry(**_LLM_RETRY)
+    def _stream_questions_document(self, prompt: PromptValue, max_tokens: int) -> Dict[str, Any]:
+        """
+        Stream the question generation response through an incremental parser
+
+        The document is built event by event, and the stream is abandoned as
+        soon as its structure goes wrong (not an object, questions not a list
+        of objects, or truncated JSON) instead of after the last token.
+
+        Raises:
+            ValueError: If the streamed output is malformed
+        """
+        stream = self.llm.stream(prompt, max_tokens=max_tokens)
+        builder = ijson.ObjectBuilder()
+        try:
+            events = ijson.parse(_LLMJsonStream(chunk.content for chunk in stream), use_float=True)
+            for prefix, event, value in events:
+                if prefix == "" and event not in _OBJECT_EVENTS:
+                    raise ValueError("Expected a JSON object from LLM")
+                if prefix == "questions" and event not in _ARRAY_EVENTS:
+                    raise ValueError("Questions must be a list")
+                if prefix == "questions.item" and event not in _OBJECT_EVENTS:
+                    raise ValueError("Each question must be an object")
+                builder.event(event, value)
+        except ijson.JSONError as json_err:
+            logger.error(f"Streamed JSON decode failed: {json_err}")
+            raise ValueError(f"Invalid JSON from LLM: {json_err}")
+        finally:
+            # Stops token generation early when validation bailed out
+            stream.close()
+
+        if builder.value is None:
+            raise ValueError("Empty response from LLM")
+        return builder.value
+
+    def _finalize_questions(self, questions_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a decoded question set, then stamp metadata"""
+        # Validate the whole structure (down to each option's score_profile)
+        # so malformed output is rejected before it is stored or scored.
+        # Strict, because the raw dict is what gets scored: lax mode would
+        # accept "8" for a score and scoring would then fail on the string
+        try:
+            AssessmentModel.model_validate(questions_data, strict=True)
+        except ValidationError as e:
+            raise ValueError(f"Invalid question set from LLM: {e}") from e
+
+        # Index option positions once so scoring is a dict lookup per answer
+        for question in questions_data["questions"]:
+            self._prepare_question(question)
+
+        # Add metadata
+        questions_data["generated_at"] = datetime.now().isoformat()
+        questions_data["total_questions"] = len(questions_data["questions"])
+        questions_data["schema_version"] = "1.0"
+
+        logger.info("Successfully generated %d questions", questions_data["total_questions"])
+        return questions_data
+
+    @staticmethod
+    def _prepare_question(question: Dict[str, Any]) -> Dict[str, Any]:
+        """Stamp option_index (option_id -> position) on a generated question"""
+        question["option_index"] = {
+            opt.get("option_id"): i for i, opt in enumerate(question.get("options", []))
+        }
+        return question
+
+    @staticmethod
+    def _find_option(question: Dict[str, Any], option_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a question option by id
+
+        Uses the option_index stamped at generation time and falls back to
+        a scan for older assessments or options that were reordered since.
+        """
+        options = question.get("options", [])
+        position = question.get("option_index", {}).get(option_id)
+        if position is not None and position < len(options):
+            option = options[position]
+            if option.get("option_id") == option_id:
+                return option
+        return next((opt for opt in options if opt.get("option_id") == option_id), None)
+
     def evaluate_responses(
         self, 
         questions_data: Dict[str, Any], 
@@ -206,61 +569,13 @@ Generate questions now:"""
             Detailed psychometric analysis dictionary
         """
         try:
-            logger.info(f"Evaluating {len(responses)} responses...")
+            logger.info("Evaluating %d responses...", len(responses))
             
             if not responses:
                 raise ValueError("No responses provided for evaluation")
 
-            # Calculate raw scores per dimension
-            dimension_scores = {dim: [] for dim in self.DIMENSIONS.keys()}
-            answered_questions = []
-
-            # Build quick lookup for questions
-            question_map = {q["question_id"]: q for q in questions_data.get("questions", [])}
-
-            for q_id, selected_option_id in responses.items():
-                question = question_map.get(q_id)
-                if not question:
-                    logger.warning(f"Question {q_id} not found in assessment data")
-                    continue
-
-                # Find selected option
-                selected_option = next(
-                    (opt for opt in question.get("options", []) 
-                     if opt.get("option_id") == selected_option_id),
-                    None
-                )
-                
-                if not selected_option:
-                    logger.warning(f"Option {selected_option_id} not found for question {q_id}")
-                    continue
-
-                # Aggregate scores
-                score_profile = selected_option.get("score_profile", {})
-                for dimension, score in score_profile.items():
-                    if dimension in dimension_scores:
-                        dimension_scores[dimension].append(score)
-
-                # Record answer details
-                answered_questions.append({
-                    "question_id": q_id,
-                    "question_text": question.get("question_text", ""),
-                    "dimension": question.get("dimension", ""),
-                    "selected_option": selected_option_id,
-                    "selected_text": selected_option.get("text", "")
-                })
-
-            # Calculate dimension averages
-            dimension_averages = {}
-            for dimension, scores in dimension_scores.items():
-                dimension_averages[dimension] = (
-                    round(sum(scores) / len(scores), 2) if scores else 0.0
-                )
-
-            # Calculate overall score
-            overall_score = (
-                round(sum(dimension_averages.values()) / len(dimension_averages), 2)
-                if dimension_averages else 0.0
+            dimension_averages, answered_questions, total_questions = self._score_responses(
+                questions_data, responses
             )
 
             # Generate AI-powered analysis
@@ -270,41 +585,180 @@ Generate questions now:"""
                 questions_data
             )
 
-            # Compile final results
-            result = {
-                "assessment_id": questions_data.get("assessment_id", "unknown"),
-                "evaluated_at": datetime.now().isoformat(),
-                "schema_version": "1.0",
-                "total_questions": len(question_map),
-                "questions_answered": len(answered_questions),
-                "completion_rate": round(
-                    len(answered_questions) / max(len(question_map), 1) * 100, 1
-                ),
-                "dimension_scores": dimension_averages,
-                "overall_score": overall_score,
-                "strengths": analysis.get("strengths", []),
-                "areas_for_development": analysis.get("areas_for_development", []),
-                "personality_profile": analysis.get("personality_profile", ""),
-                "entrepreneurial_fit": analysis.get("entrepreneurial_fit", {}),
-                "recommendations": analysis.get("recommendations", []),
-                "detailed_insights": analysis.get("detailed_insights", {}),
-                "response_details": answered_questions
-            }
-
-            logger.info(
-                f"Evaluation complete. Score: {result['overall_score']}/10, "
-                f"Completion: {result['completion_rate']}%"
+            return self._compile_result(
+                questions_data, dimension_averages, answered_questions, total_questions, analysis
             )
-            return result
 
         except Exception as e:
             logger.error(f"Response evaluation failed: {e}", exc_info=True)
             raise
 
+    def evaluate_responses_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], Dict[str, str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate a cohort of entrepreneurs with one batched round of analysis calls
+
+        Scoring runs locally for every item first; the analysis prompts for
+        cache misses are then sent together through llm.batch so they run in
+        parallel.
+
+        Args:
+            items: List of (questions_data, responses)
+
+        Returns:
+            One evaluation result per item, in the same order
+
+        Raises:
+            ValueError: If any item has no responses
+        """
+        logger.info("Evaluating a batch of %d assessments...", len(items))
+
+        scored = []
+        analyses: List[Optional[Dict[str, Any]]] = []
+        pending = []  # (position, cache key, dimension scores, prompt) for cache misses
+        for questions_data, responses in items:
+            if not responses:
+                raise ValueError("No responses provided for evaluation")
+            dimension_averages, answered_questions, total_questions = self._score_responses(
+                questions_data, responses
+            )
+            scored.append((questions_data, dimension_averages, answered_questions, total_questions))
+
+            cache_key = self._analysis_cache_key(dimension_averages)
+            analysis = self._get_cached_analysis(cache_key)
+            if analysis is None:
+                prompt = self._build_analysis_prompt(dimension_averages)
+                pending.append((len(analyses), cache_key, dimension_averages, prompt))
+            analyses.append(analysis)
+
+        if pending:
+            responses_out = self.llm.bind(max_tokens=_ANALYSIS_MAX_TOKENS).batch(
+                [prompt for _, _, _, prompt in pending],
+                config={"max_concurrency": _LLM_MAX_CONCURRENCY},
+                return_exceptions=True
+            )
+            for (position, cache_key, dimension_averages, _), response in zip(pending, responses_out):
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    analysis = self._parse_analysis(response.content)
+                    self._store_analysis(cache_key, analysis)
+                except Exception as e:
+                    logger.error(f"AI analysis generation failed: {e}")
+                    analysis = self._fallback_analysis(self._overall_score(dimension_averages))
+                analyses[position] = analysis
+
+        return [
+            self._compile_result(
+                questions_data, dimension_averages, answered_questions, total_questions, analysis
+            )
+            for (questions_data, dimension_averages, answered_questions, total_questions), analysis
+            in zip(scored, analyses)
+        ]
+
+    def _score_responses(
+        self,
+        questions_data: Dict[str, Any],
+        responses: Dict[str, str]
+    ) -> Tuple[Dict[str, float], List[AnsweredQuestion], int]:
+        """
+        Score responses against the question score profiles
+
+        Returns:
+            (dimension averages, answered question details, total questions)
+        """
+        # Running sum/count per dimension position
+        dim_index = self._DIM_INDEX
+        sums = [0.0] * len(dim_index)
+        counts = [0] * len(dim_index)
+        answered_questions: List[AnsweredQuestion] = []
+
+        # Build quick lookup for questions
+        question_map = {q["question_id"]: q for q in questions_data.get("questions", [])}
+
+        for q_id, selected_option_id in responses.items():
+            question = question_map.get(q_id)
+            if not question:
+                logger.warning("Question %s not found in assessment data", q_id)
+                continue
+
+            selected_option = self._find_option(question, selected_option_id)
+
+            if not selected_option:
+                logger.warning("Option %s not found for question %s", selected_option_id, q_id)
+                continue
+
+            # Aggregate scores
+            score_profile = selected_option.get("score_profile", {})
+            for dimension, score in score_profile.items():
+                i = dim_index.get(dimension)
+                if i is not None:
+                    sums[i] += score
+                    counts[i] += 1
+
+            # Record answer details
+            answered_questions.append(AnsweredQuestion(
+                q_id,
+                question.get("question_text", ""),
+                question.get("dimension", ""),
+                selected_option_id,
+                selected_option.get("text", "")
+            ))
+
+        # Calculate dimension averages
+        dimension_averages = {
+            dimension: round(sums[i] / counts[i], 2) if counts[i] else 0.0
+            for dimension, i in dim_index.items()
+        }
+
+        return dimension_averages, answered_questions, len(question_map)
+
+    @staticmethod
+    def _overall_score(dimension_scores: Dict[str, float]) -> float:
+        """Unweighted mean of the dimension averages"""
+        return sum(dimension_scores.values()) / len(dimension_scores) if dimension_scores else 0.0
+
+    def _compile_result(
+        self,
+        questions_data: Dict[str, Any],
+        dimension_averages: Dict[str, float],
+        answered_questions: List[AnsweredQuestion],
+        total_questions: int,
+        analysis: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble the evaluation result from scores and analysis"""
+        result = {
+            "assessment_id": questions_data.get("assessment_id", "unknown"),
+            "evaluated_at": datetime.now().isoformat(),
+            "schema_version": "1.0",
+            "total_questions": total_questions,
+            "questions_answered": len(answered_questions),
+            "completion_rate": round(
+                len(answered_questions) / max(total_questions, 1) * 100, 1
+            ),
+            "dimension_scores": dimension_averages,
+            "overall_score": round(self._overall_score(dimension_averages), 2),
+            "strengths": analysis.get("strengths", []),
+            "areas_for_development": analysis.get("areas_for_development", []),
+            "personality_profile": analysis.get("personality_profile", ""),
+            "entrepreneurial_fit": analysis.get("entrepreneurial_fit", {}),
+            "recommendations": analysis.get("recommendations", []),
+            "detailed_insights": analysis.get("detailed_insights", {}),
+            "response_details": [answer.to_dict() for answer in answered_questions]
+        }
+
+        logger.info(
+            "Evaluation complete. Score: %s/10, Completion: %s%%",
+            result["overall_score"], result["completion_rate"]
+        )
+        return result
+
     def _generate_ai_analysis(
         self,
         dimension_scores: Dict[str, float],
-        answered_questions: List[Dict[str, Any]],
+        answered_questions: List[AnsweredQuestion],
         questions_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
@@ -318,115 +772,96 @@ Generate questions now:"""
         Returns:
             Detailed analysis dictionary
         """
-        try:
-            # Prepare dimension summary
-            dimension_details = "\n".join([
-                f"- {self.DIMENSIONS[dim]['name']}: {score}/10"
-                for dim, score in sorted(dimension_scores.items(), key=lambda x: x[1], reverse=True)
-            ])
+        cache_key = self._analysis_cache_key(dimension_scores)
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
 
-            overall_score = sum(dimension_scores.values()) / len(dimension_scores) if dimension_scores else 0
-
-            prompt = f"""Analyze this entrepreneur assessment and return ONLY valid JSON.
+        try:
+            raw_response = self._call_llm_with_retry(
+                self._build_analysis_prompt(dimension_scores), max_tokens=_ANALYSIS_MAX_TOKENS
+            )
+            analysis = self._parse_analysis(raw_response)
+            self._store_analysis(cache_key, analysis)
+            return analysis
 
-DIMENSION SCORES (out of 10):
-{dimension_details}
+        except Exception as e:
+            logger.error(f"AI analysis generation failed: {e}", exc_info=True)
+            # Return safe fallback instead of crashing
+            return self._fallback_analysis(self._overall_score(dimension_scores))
 
-OVERALL SCORE: {overall_score:.2f}/10
+    @staticmethod
+    def _analysis_cache_key(dimension_scores: Dict[str, float]) -> Tuple[float, ...]:
+        """Cache key: scores rounded to 1 decimal in dimension order"""
+        return tuple(round(score, 1) for _, score in sorted(dimension_scores.items()))
+
+    def _get_cached_analysis(self, cache_key: Tuple[float, ...]) -> Optional[Dict[str, Any]]:
+        """Return a private copy of a cached analysis, or None on a miss"""
+        with self._analysis_cache_lock:
+            analysis = self._analysis_cache.get(cache_key)
+        return copy.deepcopy(analysis) if analysis is not None else None
+
+    def _store_analysis(self, cache_key: Tuple[float, ...], analysis: Dict[str, Any]) -> None:
+        """Cache a private copy of a successful LLM analysis (fallbacks are never cached)"""
+        template = copy.deepcopy(analysis)
+        with self._analysis_cache_lock:
+            self._analysis_cache[cache_key] = template
+
+    def _build_analysis_prompt(self, dimension_scores: Dict[str, float]) -> PromptValue:
+        """Build the analysis prompt: static system header, scores as the user message"""
+        return self._ANALYSIS_PROMPT.invoke({"request": (
+            "DIMENSION SCORES (out of 10):\n"
+            f"{self._DIMENSION_DETAILS_FMT.format(**dimension_scores)}\n\n"
+            f"OVERALL SCORE: {self._overall_score(dimension_scores):.2f}/10"
+        )})
+
+    def _parse_analysis(self, raw_response: str) -> Dict[str, Any]:
+        """Parse and sanity-check the analysis JSON"""
+        cleaned_content = self._clean_json_response(raw_response)
 
-Return EXACT JSON structure:
-{{
-  "personality_profile": "Concise 2-3 sentence summary of entrepreneurial personality",
-  "strengths": ["Top strength 1", "Top strength 2", "Top strength 3"],
-  "areas_for_development": ["Development area 1", "Development area 2"],
-  "entrepreneurial_fit": {{
-    "overall_fit": "High/Medium/Low",
-    "fit_score": 0-100,
-    "reasoning": "Brief explanation of fit assessment",
-    "ideal_role": "Founder/Co-founder/Intrapreneur/Advisor",
-    "ideal_venture_type": "Tech startup/Small business/Social enterprise/Corporate venture"
-  }},
-  "recommendations": ["Actionable recommendation 1", "Recommendation 2", "Recommendation 3"],
-  "detailed_insights": {{
-    "leadership_style": "Analysis of leadership approach",
-    "decision_making_pattern": "Decision-making tendencies",
-    "stress_response": "How handles pressure",
-    "growth_potential": "Development outlook",
-    "team_dynamics": "Team interaction style",
-    "unique_qualities": "Distinctive strengths"
-  }}
-}}
+        try:
+            analysis = orjson.loads(cleaned_content)
+        except orjson.JSONDecodeError as json_err:
+            logger.error(f"Analysis JSON decode failed: {json_err}")
+            raise ValueError(f"Invalid analysis JSON from LLM: {json_err}")
 
-Be specific, professional, and actionable. NO MARKDOWN, NO EXTRA TEXT."""
+        # Validate required analysis keys
+        required_keys = {"personality_profile", "strengths", "entrepreneurial_fit"}
+        missing_keys = required_keys - analysis.keys()
+        if missing_keys:
+            logger.warning(f"Analysis missing keys: {missing_keys}")
 
-            raw_response = self._call_llm_with_retry(prompt)
-            cleaned_content = self._clean_json_response(raw_response)
-            
-            try:
-                analysis = json.loads(cleaned_content)
-            except json.JSONDecodeError as json_err:
-                logger.error(f"Analysis JSON decode failed: {json_err}")
-                raise ValueError(f"Invalid analysis JSON from LLM: {json_err}")
-
-            # Validate required analysis keys
-            required_keys = {"personality_profile", "strengths", "entrepreneurial_fit"}
-            missing_keys = required_keys - analysis.keys()
-            if missing_keys:
-                logger.warning(f"Analysis missing keys: {missing_keys}")
-                
-            return analysis
+        return analysis
 
-        except Exception as e:
-            logger.error(f"AI analysis generation failed: {e}", exc_info=True)
-            # Return safe fallback instead of crashing
-            return {
-                "personality_profile": (
-                    f"Assessment indicates an overall score of {dimension_scores.get('overall_score', 0)}/10. "
-                    "Further analysis recommended."
-                ),
-                "strengths": ["Assessment completed successfully"],
-                "areas_for_development": ["Review detailed scores for specific insights"],
-                "entrepreneurial_fit": {
-                    "overall_fit": "Medium",
-                    "fit_score": 70,
-                    "reasoning": "Assessment completed. Individual results vary by dimension.",
-                    "ideal_role": "Entrepreneur",
-                    "ideal_venture_type": "Versatile"
-                },
-                "recommendations": [
-                    "Review dimension scores in detail",
-                    "Focus on top 2-3 development areas",
-                    "Consider coaching for targeted growth"
-                ],
-                "detailed_insights": {
-                    "leadership_style": "Further analysis needed",
-                    "decision_making_pattern": "Review response patterns",
-                    "stress_response": "Self-assessment recommended",
-                    "growth_potential": "Moderate to high",
-                    "team_dynamics": "Context-dependent",
-                    "unique_qualities": "Individual strengths identified"
-                }
-            }
+    @staticmethod
+    def _fallback_analysis(overall_score: float) -> Dict[str, Any]:
+        """Safe analysis returned when the LLM call or its parse fails"""
+        return {
+            "personality_profile": (
+                f"Assessment indicates an overall score of {overall_score:.2f}/10. "
+                "Further analysis recommended."
+            ),
+            **copy.deepcopy(dict(_FALLBACK_ANALYSIS_TEMPLATE))
+        }
 
 
 class PsychometricEvaluatorSingleton:
     """Thread-safe singleton for PsychometricEvaluator"""
     
     _instance: Optional[PsychometricEvaluator] = None
+    _lock = threading.Lock()
     
     @classmethod
     def get_instance(cls, **kwargs) -> PsychometricEvaluator:
-        """Get or create singleton instance"""
+        """Get or create singleton instance (double-checked locking)"""
         if cls._instance is None:
-            cls._instance = PsychometricEvaluator(**kwargs)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = PsychometricEvaluator(**kwargs)
         return cls._instance
 
 
 # Backward-compatible function
 def get_psychometric_evaluator() -> PsychometricEvaluator:
-    """Get singleton instance of psychometric evaluator"""
-    return PsychometricEvaluatorSingleton.get_instance()
-
-
-# Module-level singleton for convenience
-psychometric_evaluator = get_psychometric_evaluator()
\ No newline at end of file
+    """Get singleton instance of psychometric evaluator (created on first use)"""
+    return PsychometricEvaluatorSingleton.get_instance()
\ No newline at end of file
@@ -10,7 +10,7 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 
 # Import extensions
-from .extensions import setup_logging, init_app_config
+from .extensions import OrJSONProvider, setup_logging, init_app_config
 from .psychometric_endpoints import register_psychometric_endpoints
 from .database_manager import get_database_manager
 
@@ -30,6 +30,9 @@ def create_app() -> Flask:
     # Initialize configuration
     init_app_config(app)
     
+    # Serialize jsonify() responses with orjson
+    app.json = OrJSONProvider(app)
+    
     # Enable CORS
     CORS(app)
     
@@ -38,6 +41,7 @@ def create_app() -> Flask:
     # Initialize database manager
     try:
         db_manager = get_database_manager()
+        app.extensions["db"] = db_manager
         logger.info("Database manager connected")
     except Exception as e:
         logger.error(f"Database connection warning: {e}")
@@ -5,13 +5,72 @@ Creates and manages entrepreneur and mentor profiles based on psychometric asses
 Integrates profiles with idea validation for personalized recommendations
 """
 
+import os
+import atexit
+import functools
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime
+import threading
+from typing import Callable, Dict, Optional, List, Tuple
+from datetime import datetime, timezone
+from cachetools import TTLCache
+from pymongo import UpdateOne
 from .database_manager import get_database_manager
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+_now = datetime.now
+
+
+def _utc_now_iso() -> str:
+    """Current time as an offset-aware UTC ISO-8601 string for profile fields"""
+    return _now(_UTC).isoformat()
+
+
+def _top(items, n: int = 5) -> List:
+    """First n items of a list, without copying when it is already short enough"""
+    if not isinstance(items, list):
+        return []
+    return items if len(items) <= n else items[:n]
+
+
+def _tail(items, n: int = 3) -> List:
+    """Last n items of a list, without copying when it is already short enough"""
+    if not isinstance(items, list):
+        return []
+    return items if len(items) <= n else items[-n:]
+
+# Seconds a fetched profile is served from memory (writes invalidate it)
+_PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", 30))
+
+# Named partial views of a profile for get_profile. validation_context
+# carries what get_personalized_validation_context reads: summary fields,
+# the last 3 history entries and the history length, so the unbounded
+# history array never leaves the server
+_PROFILE_VIEWS = {
+    "validation_context": {
+        "user_name": 1,
+        "entrepreneurial_fit": 1,
+        "fit_score": 1,
+        "ideal_role": 1,
+        "top_strengths": 1,
+        "development_areas": 1,
+        "validation_focus_areas": 1,
+        "risk_tolerance_level": 1,
+        "psychometric_scores": 1,
+        "personality_profile": 1,
+        "detailed_insights.leadership_style": 1,
+        "detailed_insights.decision_making_pattern": 1,
+        "validation_history": {"$slice": -3},
+        "validation_count": {"$size": {"$ifNull": ["$validation_history", []]}},
+    },
+}
+
+# Validation history appends are buffered per user and flushed as one bulk
+# write after this many seconds, or at once when this many entries queue up
+_HISTORY_FLUSH_INTERVAL = int(os.getenv("HISTORY_FLUSH_MS", 500)) / 1000
+_HISTORY_MAX_BATCH = int(os.getenv("HISTORY_MAX_BATCH", 100))
+
 
 class UserProfileManager:
     """
@@ -25,8 +84,41 @@ class UserProfileManager:
         self.db_manager = get_database_manager()
         if not self.db_manager:
             logger.warning("Database manager not available - profiles will not be persisted")
+        # Profiles keyed by (user_id, user_type, view); treat cached docs as read-only
+        self._profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_PROFILE_CACHE_TTL)
+        self._profile_cache_lock = threading.Lock()
+        # Callbacks run with the user_id whenever a profile is invalidated,
+        # for caches layered on top of this one (e.g. serialized responses)
+        self._invalidation_listeners: List[Callable[[str], None]] = []
+        # Pending validation history entries per user_id
+        self._history_buffer: Dict[str, List[Dict]] = {}
+        self._history_pending = 0
+        self._history_lock = threading.Lock()
+        self._history_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush_validation_history)
         logger.info("User Profile Manager initialized")
 
+    def add_invalidation_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback run with the user_id after a profile is written
+        
+        Args:
+            callback: Called as callback(user_id); exceptions are logged
+        """
+        self._invalidation_listeners.append(callback)
+
+    def _invalidate_profile(self, user_id: str, user_type: str) -> None:
+        """Drop every cached view of a profile after it has been written"""
+        with self._profile_cache_lock:
+            self._profile_cache.pop((user_id, user_type, None), None)
+            for view in _PROFILE_VIEWS:
+                self._profile_cache.pop((user_id, user_type, view), None)
+        for callback in self._invalidation_listeners:
+            try:
+                callback(user_id)
+            except Exception as e:
+                logger.warning(f"Profile invalidation listener failed: {e}")
+
     def create_profile_from_psychometric(
         self,
         user_id: str,
@@ -42,12 +134,11 @@ class UserProfileManager:
             user_type: 'entrepreneur' or 'mentor'
         
         Returns:
-            User profile dictionary
+            The profile fields that were written (created_at and the
+            history list are kept from the stored profile)
         """
         try:
             logger.info(f"Creating {user_type} profile for user: {user_id}")
-            print(f"\n📝 Creating {user_type.upper()} profile...")
-            
             if user_type == 'mentor':
                 return self._create_mentor_profile(user_id, evaluation_result)
             else:
@@ -64,34 +155,36 @@ class UserProfileManager:
     ) -> Dict:
         """Create entrepreneur profile from psychometric evaluation"""
         try:
-            # Extract key information from evaluation
-            dimension_scores = evaluation_result.get('dimension_scores', {})
-            entrepreneurial_fit = evaluation_result.get('entrepreneurial_fit', {})
-            strengths = evaluation_result.get('strengths', [])
-            weaknesses = evaluation_result.get('areas_for_development', [])
-            personality_profile = evaluation_result.get('personality_profile', '')
+            # Extract key information from evaluation (bound once)
+            get = evaluation_result.get
+            dimension_scores = get('dimension_scores', {})
+            entrepreneurial_fit = get('entrepreneurial_fit', {})
+            strengths = get('strengths', [])
+            weaknesses = get('areas_for_development', [])
+            personality_profile = get('personality_profile', '')
+            fit_get = entrepreneurial_fit.get
+            now_iso = _utc_now_iso()
 
             # Calculate profile metadata
             profile = {
                 "user_id": user_id,
                 "profile_type": "entrepreneur",
-                "user_name": evaluation_result.get('user_name', 'Unknown'),
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "user_name": get('user_name', 'Unknown'),
+                "last_updated": now_iso,
                 
                 # Psychometric scores
                 "psychometric_scores": dimension_scores,
-                "overall_psychometric_score": evaluation_result.get('overall_score', 0),
+                "overall_psychometric_score": get('overall_score', 0),
                 
                 # Entrepreneurial assessment
-                "entrepreneurial_fit": entrepreneurial_fit.get('overall_fit', 'Medium'),
-                "fit_score": entrepreneurial_fit.get('fit_score', 50),
-                "ideal_role": entrepreneurial_fit.get('ideal_role', 'Entrepreneur'),
-                "ideal_venture_type": entrepreneurial_fit.get('ideal_venture_type', 'Various'),
+                "entrepreneurial_fit": fit_get('overall_fit', 'Medium'),
+                "fit_score": fit_get('fit_score', 50),
+                "ideal_role": fit_get('ideal_role', 'Entrepreneur'),
+                "ideal_venture_type": fit_get('ideal_venture_type', 'Various'),
                 
                 # Strengths and weaknesses
-                "top_strengths": strengths[:5],  # Top 5 strengths
-                "development_areas": weaknesses[:5],  # Top 5 areas
+                "top_strengths": _top(strengths),  # Top 5 strengths
+                "development_areas": _top(weaknesses),  # Top 5 areas
                 
                 # Profile summary
                 "personality_profile": personality_profile,
@@ -103,42 +196,42 @@ class UserProfileManager:
                 ),
                 
                 # Recommendations context
-                "detailed_insights": evaluation_result.get('detailed_insights', {}),
-                "recommendations": evaluation_result.get('recommendations', []),
+                "detailed_insights": get('detailed_insights', {}),
+                "recommendations": get('recommendations', []),
                 
                 # Profile status
                 "profile_completeness": self._calculate_completeness(evaluation_result),
                 "profile_version": "1.0",
                 
                 # Reference to evaluation
-                "evaluation_id": evaluation_result.get('evaluation_id'),
-                "assessment_date": evaluation_result.get('evaluated_at')
+                "evaluation_id": get('evaluation_id'),
+                "assessment_date": get('evaluated_at')
             }
 
             # Save to database
             if self.db_manager is not None and self.db_manager.db is not None:
                 try:
-                    # Check if profile exists
-                    existing_profile = self.db_manager.db.entrepreneur_profiles.find_one(
-                        {"user_id": user_id}
+                    # One atomic upsert: creation time and history are only
+                    # written when the profile is new, so they survive updates
+                    result = self.db_manager.db.entrepreneur_profiles.update_one(
+                        {"user_id": user_id},
+                        {
+                            "$set": profile,
+                            "$setOnInsert": {
+                                "created_at": now_iso,
+                                "validation_history": []
+                            }
+                        },
+                        upsert=True
                     )
-
-                    if existing_profile:
-                        # Update existing profile
-                        profile['created_at'] = existing_profile.get('created_at')
-                        profile['validation_history'] = existing_profile.get('validation_history', [])
-                        self.db_manager.db.entrepreneur_profiles.update_one(
-                            {"user_id": user_id},
-                            {"$set": profile}
-                        )
+                    if result.upserted_id is None:
                         logger.info(f"Updated existing entrepreneur profile for user: {user_id}")
                     else:
-                        # Create new profile
-                        profile['validation_history'] = []
-                        self.db_manager.db.entrepreneur_profiles.insert_one(profile)
                         logger.info(f"Created new entrepreneur profile for user: {user_id}")
                 except Exception as e:
                     logger.error(f"Failed to save entrepreneur profile to database: {e}")
+                finally:
+                    self._invalidate_profile(user_id, 'entrepreneur')
 
             return profile
 
@@ -153,33 +246,36 @@ class UserProfileManager:
     ) -> Dict:
         """Create mentor profile from psychometric evaluation"""
         try:
-            # Extract key information from mentor evaluation
-            dimension_scores = evaluation_result.get('dimension_scores', {})
-            mentoring_fit = evaluation_result.get('mentoring_fit', {})
-            strengths = evaluation_result.get('mentor_strengths', evaluation_result.get('strengths', []))
-            development_areas = evaluation_result.get('development_areas', [])
-            mentor_profile_summary = evaluation_result.get('mentor_profile_summary', '')
-            teaching_style = evaluation_result.get('teaching_style', '')
-            ideal_mentee_profile = evaluation_result.get('ideal_mentee_profile', {})
-            mentoring_capacity = evaluation_result.get('mentoring_capacity', '')
-            expertise_domains = evaluation_result.get('expertise_domains', [])
+            # Extract key information from mentor evaluation (bound once)
+            get = evaluation_result.get
+            dimension_scores = get('dimension_scores', {})
+            mentoring_fit = get('mentoring_fit', {})
+            strengths = get('mentor_strengths', get('strengths', []))
+            development_areas = get('development_areas', [])
+            mentor_profile_summary = get('mentor_profile_summary', '')
+            teaching_style = get('teaching_style', '')
+            ideal_mentee_profile = get('ideal_mentee_profile', {})
+            mentoring_capacity = get('mentoring_capacity', '')
+            expertise_domains = get('expertise_domains', [])
+            fit_get = mentoring_fit.get
+            mentee_get = ideal_mentee_profile.get
+            now_iso = _utc_now_iso()
 
             # Calculate profile metadata
             profile = {
                 "user_id": user_id,
                 "profile_type": "mentor",
-                "user_name": evaluation_result.get('user_name', 'Unknown'),
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "user_name": get('user_name', 'Unknown'),
+                "last_updated": now_iso,
                 
                 # Psychometric scores (mentor-specific)
                 "psychometric_scores": dimension_scores,
-                "overall_mentor_score": evaluation_result.get('overall_mentor_score', 0),
+                "overall_mentor_score": get('overall_mentor_score', 0),
                 
                 # Mentoring assessment
-                "mentoring_fit": mentoring_fit.get('overall_fit', 'Moderate'),
-                "fit_score": mentoring_fit.get('fit_score', 50),
-                "mentoring_readiness": mentoring_fit.get('mentoring_readiness', 'Needs Development'),
+                "mentoring_fit": fit_get('overall_fit', 'Moderate'),
+                "fit_score": fit_get('fit_score', 50),
+                "mentoring_readiness": fit_get('mentoring_readiness', 'Needs Development'),
                 
                 # Teaching approach
                 "teaching_style": teaching_style,
@@ -187,61 +283,56 @@ class UserProfileManager:
                 "expertise_domains": expertise_domains,
                 
                 # Strengths and development areas
-                "top_strengths": strengths[:5] if isinstance(strengths, list) else [],
-                "development_areas": development_areas[:5] if isinstance(development_areas, list) else [],
+                "top_strengths": _top(strengths),
+                "development_areas": _top(development_areas),
                 
                 # Profile summary
                 "mentor_profile_summary": mentor_profile_summary,
                 
                 # Ideal mentee matching
                 "ideal_mentee_profile": ideal_mentee_profile,
-                "mentee_experience_level": ideal_mentee_profile.get('experience_level', ''),
-                "mentee_personality_fit": ideal_mentee_profile.get('personality_fit', ''),
-                "challenge_areas": ideal_mentee_profile.get('challenge_areas', ''),
-                "industry_fit": ideal_mentee_profile.get('industry_fit', ''),
+                "mentee_experience_level": mentee_get('experience_level', ''),
+                "mentee_personality_fit": mentee_get('personality_fit', ''),
+                "challenge_areas": mentee_get('challenge_areas', ''),
+                "industry_fit": mentee_get('industry_fit', ''),
                 
                 # Recommendations context
-                "detailed_insights": evaluation_result.get('detailed_insights', {}),
-                "recommendations": evaluation_result.get('recommendations', []),
+                "detailed_insights": get('detailed_insights', {}),
+                "recommendations": get('recommendations', []),
                 
                 # Profile status
                 "profile_completeness": self._calculate_completeness(evaluation_result),
                 "profile_version": "1.0",
                 
                 # Reference to evaluation
-                "evaluation_id": evaluation_result.get('evaluation_id'),
-                "assessment_date": evaluation_result.get('evaluated_at'),
-                
-                # Mentoring history
-                "mentoring_history": []
+                "evaluation_id": get('evaluation_id'),
+                "assessment_date": get('evaluated_at')
             }
 
             # Save to database
             if self.db_manager is not None and self.db_manager.db is not None:
                 try:
-                    # Check if profile exists
-                    existing_profile = self.db_manager.db.mentor_profiles.find_one(
-                        {"user_id": user_id}
+                    # One atomic upsert: creation time and history are only
+                    # written when the profile is new, so they survive updates
+                    result = self.db_manager.db.mentor_profiles.update_one(
+                        {"user_id": user_id},
+                        {
+                            "$set": profile,
+                            "$setOnInsert": {
+                                "created_at": now_iso,
+                                "mentoring_history": []
+                            }
+                        },
+                        upsert=True
                     )
-
-                    if existing_profile:
-                        # Update existing profile
-                        profile['created_at'] = existing_profile.get('created_at')
-                        profile['mentoring_history'] = existing_profile.get('mentoring_history', [])
-                        self.db_manager.db.mentor_profiles.update_one(
-                            {"user_id": user_id},
-                            {"$set": profile}
-                        )
+                    if result.upserted_id is None:
                         logger.info(f"Updated existing mentor profile for user: {user_id}")
-                        print(f"✅ Updated existing mentor profile in database")
                     else:
-                        # Create new profile
-                        self.db_manager.db.mentor_profiles.insert_one(profile)
                         logger.info(f"Created new mentor profile for user: {user_id}")
-                        print(f"✅ Created new mentor profile in database")
                 except Exception as e:
                     logger.error(f"Failed to save mentor profile to database: {e}")
-                    print(f"❌ Failed to save mentor profile: {e}")
+                finally:
+                    self._invalidate_profile(user_id, 'mentor')
 
             return profile
 
@@ -249,13 +340,19 @@ class UserProfileManager:
             logger.error(f"Failed to create mentor profile: {e}")
             raise
 
-    def get_profile(self, user_id: str, user_type: str = 'entrepreneur') -> Optional[Dict]:
+    def get_profile(
+        self,
+        user_id: str,
+        user_type: str = 'entrepreneur',
+        view: Optional[str] = None
+    ) -> Optional[Dict]:
         """
-        Retrieve user profile
+        Retrieve user profile (cached briefly; treat the result as read-only)
         
         Args:
             user_id: Unique user identifier
             user_type: 'entrepreneur' or 'mentor'
+            view: Optional name from _PROFILE_VIEWS to fetch only those fields
         
         Returns:
             User profile or None if not found
@@ -264,11 +361,20 @@ class UserProfileManager:
             if self.db_manager is None or self.db_manager.db is None:
                 return None
 
+            cache_key = (user_id, user_type, view)
+            with self._profile_cache_lock:
+                profile = self._profile_cache.get(cache_key)
+            if profile is not None:
+                return profile
+
             collection_name = 'mentor_profiles' if user_type == 'mentor' else 'entrepreneur_profiles'
-            profile = self.db_manager.db[collection_name].find_one({"user_id": user_id})
+            projection = _PROFILE_VIEWS[view] if view else None
+            profile = self.db_manager.db[collection_name].find_one({"user_id": user_id}, projection)
             
             if profile:
                 profile['_id'] = str(profile['_id'])
+                with self._profile_cache_lock:
+                    self._profile_cache[cache_key] = profile
                 logger.info(f"Retrieved {user_type} profile for user: {user_id}")
                 return profile
             else:
@@ -302,22 +408,72 @@ class UserProfileManager:
             validation_entry = {
                 "idea_name": idea_name,
                 "report_id": report_id,
-                "validated_at": datetime.now().isoformat(),
+                "validated_at": _utc_now_iso(),
                 "overall_score": validation_result.get('overall_score', 0),
                 "validation_outcome": validation_result.get('validation_outcome', 'N/A')
             }
 
-            self.db_manager.db.entrepreneur_profiles.update_one(
+            batch = None
+            with self._history_lock:
+                self._history_buffer.setdefault(user_id, []).append(validation_entry)
+                self._history_pending += 1
+                if self._history_pending >= _HISTORY_MAX_BATCH:
+                    batch = self._take_validation_history()
+                elif self._history_timer is None:
+                    self._history_timer = threading.Timer(
+                        _HISTORY_FLUSH_INTERVAL, self.flush_validation_history
+                    )
+                    self._history_timer.daemon = True
+                    self._history_timer.start()
+            if batch:
+                self._write_validation_history(batch)
+            else:
+                # Readers should not keep serving the pre-validation history;
+                # the flush invalidates again once the entry is stored
+                self._invalidate_profile(user_id, 'entrepreneur')
+            logger.info(f"Queued validation for history of user: {user_id}")
+
+        except Exception as e:
+            logger.error(f"Failed to add validation to history: {e}")
+
+    def flush_validation_history(self) -> None:
+        """Write every buffered validation history entry now"""
+        with self._history_lock:
+            batch = self._take_validation_history()
+        if batch:
+            self._write_validation_history(batch)
+
+    def _take_validation_history(self) -> Dict[str, List[Dict]]:
+        """Detach the buffered entries and disarm the timer (lock held)"""
+        batch, self._history_buffer = self._history_buffer, {}
+        self._history_pending = 0
+        if self._history_timer is not None:
+            self._history_timer.cancel()
+            self._history_timer = None
+        return batch
+
+    def _write_validation_history(self, batch: Dict[str, List[Dict]]) -> None:
+        """One unordered bulk write with a single $push per user"""
+        now_iso = _utc_now_iso()
+        operations = [
+            UpdateOne(
                 {"user_id": user_id},
                 {
-                    "$push": {"validation_history": validation_entry},
-                    "$set": {"last_updated": datetime.now().isoformat()}
+                    "$push": {"validation_history": {"$each": entries}},
+                    "$set": {"last_updated": now_iso}
                 }
             )
-            logger.info(f"Added validation to history for user: {user_id}")
-
+            for user_id, entries in batch.items()
+        ]
+        try:
+            self.db_manager.db.entrepreneur_profiles.bulk_write(operations, ordered=False)
+            logger.debug("Flushed validation history for %d users", len(operations))
         except Exception as e:
-            logger.error(f"Failed to add validation to history: {e}")
+            logger.error(f"Failed to flush validation history for {len(operations)} users: {e}")
+        finally:
+            # Drop cached profiles only once the entries are in the database
+            for user_id in batch:
+                self._invalidate_profile(user_id, 'entrepreneur')
 
     def get_personalized_validation_context(self, user_id: str) -> Dict:
         """
@@ -330,7 +486,7 @@ class UserProfileManager:
             Context dictionary for validation customization
         """
         try:
-            profile = self.get_profile(user_id, user_type='entrepreneur')
+            profile = self.get_profile(user_id, user_type='entrepreneur', view='validation_context')
             
             if not profile:
                 return {
@@ -367,8 +523,10 @@ class UserProfileManager:
                 "decision_making_pattern": profile.get('detailed_insights', {}).get('decision_making_pattern', ''),
                 
                 # Previous validations
-                "validation_count": len(profile.get('validation_history', [])),
-                "previous_ideas": [v.get('idea_name') for v in profile.get('validation_history', [])[-3:]]
+                "validation_count": profile.get(
+                    'validation_count', len(profile.get('validation_history', []))
+                ),
+                "previous_ideas": [v.get('idea_name') for v in _tail(profile.get('validation_history', []))]
             }
 
             logger.info(f"Generated personalized context for user: {user_id}")
@@ -391,35 +549,13 @@ class UserProfileManager:
         Returns:
             List of focus areas for validation
         """
-        focus_areas = []
-
-        # Map dimensions to validation focus areas
-        dimension_to_focus = {
-            'leadership': 'Team & Leadership Evaluation',
-            'risk_tolerance': 'Risk Assessment & Mitigation',
-            'resilience': 'Sustainability & Long-term Viability',
-            'innovation': 'Innovation & Differentiation',
-            'decision_making': 'Business Model & Strategy',
-            'emotional_intelligence': 'Stakeholder Management',
-            'persistence': 'Execution Capability',
-            'strategic_thinking': 'Market Strategy & Positioning',
-            'communication': 'Go-to-Market & Sales',
-            'problem_solving': 'Problem-Solution Fit'
-        }
-
-        # Identify weak dimensions (score < 5)
-        for dimension, score in dimension_scores.items():
-            if score < 5 and dimension in dimension_to_focus:
-                focus_areas.append(dimension_to_focus[dimension])
-
-        # If no weak areas, focus on top performers for leverage
-        if not focus_areas:
-            sorted_dims = sorted(dimension_scores.items(), key=lambda x: x[1], reverse=True)
-            for dimension, _ in sorted_dims[:3]:
-                if dimension in dimension_to_focus:
-                    focus_areas.append(dimension_to_focus[dimension])
-
-        return focus_areas
+        items = tuple(dimension_scores.items())
+        try:
+            return list(_focus_areas_for(items))
+        except TypeError:
+            # Unhashable score values (e.g. nested docs in stored profiles)
+            # cannot key the memo; compute them uncached as before
+            return list(_focus_areas_for.__wrapped__(items))
 
     def _categorize_risk_tolerance(self, risk_score: float) -> str:
         """
@@ -454,17 +590,7 @@ class UserProfileManager:
         filled_fields = 0
 
         # Check key fields
-        fields_to_check = [
-            'dimension_scores',
-            'entrepreneurial_fit',
-            'strengths',
-            'areas_for_development',
-            'personality_profile',
-            'detailed_insights',
-            'recommendations'
-        ]
-
-        for field in fields_to_check:
+        for field in _COMPLETENESS_FIELDS:
             total_fields += 1
             value = evaluation_result.get(field)
             if value:
@@ -477,13 +603,64 @@ class UserProfileManager:
         return round(completeness, 1)
 
 
+# Validation focus area for each psychometric dimension
+_DIMENSION_TO_FOCUS = {
+    'leadership': 'Team & Leadership Evaluation',
+    'risk_tolerance': 'Risk Assessment & Mitigation',
+    'resilience': 'Sustainability & Long-term Viability',
+    'innovation': 'Innovation & Differentiation',
+    'decision_making': 'Business Model & Strategy',
+    'emotional_intelligence': 'Stakeholder Management',
+    'persistence': 'Execution Capability',
+    'strategic_thinking': 'Market Strategy & Positioning',
+    'communication': 'Go-to-Market & Sales',
+    'problem_solving': 'Problem-Solution Fit'
+}
+
+# Evaluation fields that count towards profile completeness
+_COMPLETENESS_FIELDS = (
+    'dimension_scores',
+    'entrepreneurial_fit',
+    'strengths',
+    'areas_for_development',
+    'personality_profile',
+    'detailed_insights',
+    'recommendations'
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _focus_areas_for(dimension_scores: Tuple[Tuple[str, float], ...]) -> Tuple[str, ...]:
+    """Focus areas for (dimension, score) pairs in evaluation order (memoized)"""
+    # Identify weak dimensions (score < 5)
+    focus_areas = [
+        _DIMENSION_TO_FOCUS[dimension]
+        for dimension, score in dimension_scores
+        if score < 5 and dimension in _DIMENSION_TO_FOCUS
+    ]
+
+    # If no weak areas, focus on top performers for leverage
+    if not focus_areas:
+        sorted_dims = sorted(dimension_scores, key=lambda x: x[1], reverse=True)
+        focus_areas = [
+            _DIMENSION_TO_FOCUS[dimension]
+            for dimension, _ in sorted_dims[:3]
+            if dimension in _DIMENSION_TO_FOCUS
+        ]
+
+    return tuple(focus_areas)
+
+
 # Singleton instance storage
 _profile_manager_instance: Optional[UserProfileManager] = None
+_profile_manager_lock = threading.Lock()
 
 
 def get_user_profile_manager() -> UserProfileManager:
-    """Get singleton instance of user profile manager"""
+    """Get singleton instance of user profile manager (one per process)"""
     global _profile_manager_instance
     if _profile_manager_instance is None:
-        _profile_manager_instance = UserProfileManager()
+        with _profile_manager_lock:
+            if _profile_manager_instance is None:
+                _profile_manager_instance = UserProfileManager()
     return _profile_manager_instance
@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for Pragati Psychometric Server
+
+Run with:
+    gunicorn -c gunicorn_conf.py "app.server:create_app()"
+"""
+
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 7000)}"
+
+# Threaded workers: requests spend most of their time waiting on the LLM
+# and MongoDB, so a few threads per process keep the CPU busy
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+# LLM retries stop starting new attempts after 60s, but a single attempt can
+# run up to the client timeout; raise this if long generations get killed
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Off by default: create_app() opens the MongoClient and starts the logging
+# listener thread, and neither survives fork() into the workers. Only enable
+# when those are known to be created lazily per worker
+preload_app = os.getenv("GUNICORN_PRELOAD", "false").lower() == "true"
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -1,6 +1,7 @@
 """
 Pragati Psychometric Server - Entry Point
-Run with: python run.py or python3 run.py
+Run with: python run.py or python3 run.py (development only)
+Production: gunicorn -c gunicorn_conf.py "app.server:create_app()"
 """
 
 import os
@@ -32,5 +33,9 @@ if __name__ == "__main__":
     print(f"📍 Health Check: http://{host}:{port}/health")
     print("="*70 + "\n")
     
+    if not debug:
+        print("⚠️  Werkzeug dev server is not meant for production; use:")
+        print('   gunicorn -c gunicorn_conf.py "app.server:create_app()"\n')
+    
     # Run the application
     app.run(host=host, port=port, debug=debug)